@@ -0,0 +1,14 @@
+"""
+Root pytest configuration
+
+Makes the ``src`` package importable when the project has not been
+installed (``pip install -e .`` makes this a no-op).
+"""
+
+import sys
+from pathlib import Path
+
+if "src" not in sys.modules:
+    ROOT = str(Path(__file__).resolve().parent)
+    if ROOT not in sys.path:
+        sys.path.insert(0, ROOT)
@@ -68,6 +68,7 @@ def convert_raw_files(raw_file_paths, output_dir="Results/data/02_mzml_files"):
         audit.log(error_msg, level="ERROR")
         print(f"❌ {error_msg}")
         audit.save()
+        audit.close()
         return []
 
     # Convert files
@@ -144,6 +145,7 @@ def convert_raw_files(raw_file_paths, output_dir="Results/data/02_mzml_files"):
 
     # Print text log location
     print(f"📋 Human-readable log: {audit.text_log_path}")
+    audit.close()
 
     return mzml_files
 
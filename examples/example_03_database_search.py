@@ -275,6 +275,7 @@ def main():
     print("="*80)
 
     logger.log("Database search example completed successfully", level="INFO")
+    logger.close()
 
     # Clean up
     import os
@@ -14,9 +14,10 @@ Implements the 10 ALCOA++ principles for pharmaceutical-grade data integrity:
 - Traceable: Complete audit trail
 """
 
-from .audit_logger import AuditLogger
+from .audit_logger import AuditLogger, format_timestamp
 from .checksum_manager import ChecksumManager
 from .metadata_generator import MetadataGenerator
 from .compliance_validator import ComplianceValidator
 
-__all__ = ["AuditLogger", "ChecksumManager", "MetadataGenerator", "ComplianceValidator"]
+__all__ = ["AuditLogger", "ChecksumManager", "MetadataGenerator", "ComplianceValidator",
+           "format_timestamp"]
@@ -0,0 +1,154 @@
+"""
+ALCOA++ JSON Output
+
+Writes audit and metadata records as UTF-8 JSON (indented documents or
+compact NDJSON lines), using orjson when it is installed and the standard
+library json module otherwise. Values that
+are not JSON types are written as their str() in both cases; NumPy scalars
+and arrays are written as numbers with orjson.
+
+JSON documents whose path ends in ``.gz`` are gzip-compressed and those
+ending in ``.zst`` are Zstandard-compressed (requires the zstandard
+package); load_json() detects the compression from the file contents.
+"""
+
+import gzip
+import json
+from pathlib import Path
+from typing import Any, Optional, Union
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+_GZIP_MAGIC = b"\x1f\x8b"
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+# zstd level 3 and gzip level 6 are the libraries' defaults: most of the
+# size reduction on repetitive JSON at a small fraction of the max-level cost
+ZSTD_LEVEL = 3
+GZIP_LEVEL = 6
+
+
+def compression_for(path: Union[str, Path]) -> Optional[str]:
+    """
+    Compression implied by a file name
+
+    Parameters
+    ----------
+    path : str or Path
+        File path
+
+    Returns
+    -------
+    str or None
+        "gzip" for ``.gz``, "zstd" for ``.zst``, None otherwise
+    """
+    suffix = Path(path).suffix.lower()
+    if suffix == ".gz":
+        return "gzip"
+    if suffix == ".zst":
+        return "zstd"
+    return None
+
+
+def _require_zstd():
+    if not ZSTD_AVAILABLE:
+        raise ImportError("zstandard is required for .zst files: pip install zstandard")
+
+
+def dump_json(obj: Any, output_path: Union[str, Path], compression: Optional[str] = "infer"):
+    """
+    Write an object to a JSON file with 2-space indentation
+
+    Parameters
+    ----------
+    obj : Any
+        JSON-serializable object (other values fall back to str())
+    output_path : str or Path
+        Destination file
+    compression : str, optional
+        "gzip", "zstd" or None; "infer" (default) picks it from the
+        output_path suffix (see compression_for)
+    """
+    if compression == "infer":
+        compression = compression_for(output_path)
+
+    if ORJSON_AVAILABLE:
+        data = orjson.dumps(
+            obj,
+            default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        )
+    else:
+        data = json.dumps(obj, indent=2, default=str).encode('utf-8')
+
+    if compression == "gzip":
+        data = gzip.compress(data, compresslevel=GZIP_LEVEL)
+    elif compression == "zstd":
+        _require_zstd()
+        data = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+    elif compression is not None:
+        raise ValueError(f"Unknown compression: {compression}")
+
+    with open(output_path, 'wb') as f:
+        f.write(data)
+
+
+def load_json(input_path: Union[str, Path]) -> Any:
+    """
+    Read a JSON file written by dump_json, compressed or not
+
+    Parameters
+    ----------
+    input_path : str or Path
+        Source file
+
+    Returns
+    -------
+    Any
+        Decoded JSON document
+    """
+    with open(input_path, 'rb') as f:
+        data = f.read()
+
+    if data.startswith(_GZIP_MAGIC):
+        data = gzip.decompress(data)
+    elif data.startswith(_ZSTD_MAGIC):
+        _require_zstd()
+        data = zstandard.ZstdDecompressor().decompressobj().decompress(data)
+
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_line(obj: Any) -> bytes:
+    """
+    Serialize an object as one compact NDJSON line
+
+    Parameters
+    ----------
+    obj : Any
+        JSON-serializable object (other values fall back to str())
+
+    Returns
+    -------
+    bytes
+        UTF-8 JSON terminated by a newline
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(
+            obj,
+            default=str,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+        )
+    return (json.dumps(obj, default=str, separators=(',', ':')) + '\n').encode('utf-8')
@@ -6,12 +6,54 @@ All events are timestamped and associated with user/system context.
 """
 
 import os
+import sys
 import json
 import logging
-from datetime import datetime
+import platform
+import time
+import weakref
+from collections import Counter
+from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 
+from ._jsonio import dump_json, json_line
+
+
+@lru_cache(maxsize=1)
+def _system_info() -> Dict[str, str]:
+    """
+    System information for attributability, gathered once per process
+
+    platform.processor() and friends can spawn a subprocess on some
+    systems and never change within a run, so the result is cached.
+    """
+    return {
+        "python_version": sys.version,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "hostname": platform.node(),
+    }
+
+
+def format_timestamp(t_ns: int) -> str:
+    """
+    Format an event's ``t_ns`` (nanoseconds since the epoch) as ISO 8601 UTC
+
+    Parameters
+    ----------
+    t_ns : int
+        Event time as recorded by AuditLogger.log
+
+    Returns
+    -------
+    str
+        Timestamp such as ``2024-01-01T12:00:00.123456+00:00``
+    """
+    return datetime.fromtimestamp(t_ns / 1e9, tz=timezone.utc).isoformat()
+
 
 class AuditLogger:
     """
@@ -21,6 +63,21 @@ class AuditLogger:
     - Attributable: Records user, system, and version information
     - Contemporaneous: Real-time timestamping of all events
     - Traceable: Complete operation history with parameters
+
+    Every event is appended to ``<run_id>_audit_events.ndjson`` as it is
+    logged; save() writes the run summary that points to that file. The
+    events file is created exclusively, so each logger gets its own file: if
+    the run_id is already taken in log_dir, a numeric suffix is appended
+    (check ``run_id`` after construction). Call close(), or use the logger as
+    a context manager, when the run is finished; logging after close() raises
+    ValueError. A logger that is garbage-collected without close() still
+    flushes and closes its events file.
+
+    In memory, events carry their time as integer ``t_ns`` (nanoseconds
+    since the epoch, UTC; use format_timestamp() to render it). Each line in
+    the events file also has the ISO 8601 ``timestamp``, and the run
+    summary's start/end times and ``start_time`` are UTC as well (so are
+    auto-generated run IDs).
     """
 
     def __init__(
@@ -47,16 +104,18 @@ class AuditLogger:
         self.log_dir = Path(log_dir)
         self.log_dir.mkdir(parents=True, exist_ok=True)
 
-        # Generate run ID
-        self.run_id = run_id or datetime.now().strftime("%Y%m%d_%H%M%S")
-        self.start_time = datetime.now()
+        # Same UTC clock as the event t_ns, so one record never mixes time zones
+        self._start_ns = time.time_ns()
+        self.start_time = datetime.fromtimestamp(self._start_ns / 1e9, tz=timezone.utc)
 
         # Attributable: Capture user and system context
         self.user = user or os.getlogin()
         self.system_info = system_info or self._get_system_info()
 
-        # Event log
+        # Event log, kept in memory and streamed to an append-only NDJSON file
         self.events: List[Dict[str, Any]] = []
+        self._level_counts: Counter = Counter()
+        self._open_events_file(run_id)
 
         # Initialize text logger (LEGIBLE principle)
         self.text_log_path = self.log_dir / f"{self.run_id}_processing_log.txt"
@@ -69,18 +128,33 @@ class AuditLogger:
             "system": self.system_info
         })
 
+    def _open_events_file(self, run_id: Optional[str]):
+        """
+        Create the NDJSON events file and set run_id and events_path
+
+        Parameters
+        ----------
+        run_id : str, optional
+            Requested run ID, or None for a timestamp ID. Either is
+            suffixed (_2, _3, ...) until its events file name is free
+        """
+        base = run_id or self.start_time.strftime("%Y%m%d_%H%M%S")
+        attempt = 1
+        while True:
+            self.run_id = base if attempt == 1 else f"{base}_{attempt}"
+            self.events_path = self.log_dir / f"{self.run_id}_audit_events.ndjson"
+            try:
+                self._events_fh = open(self.events_path, 'xb', buffering=1 << 20)
+            except FileExistsError:
+                attempt += 1
+                continue
+            # Flush the buffered tail if the logger is dropped without close()
+            self._events_finalizer = weakref.finalize(self, self._events_fh.close)
+            return
+
     def _get_system_info(self) -> Dict[str, str]:
         """Collect system information for attributability"""
-        import platform
-        import sys
-
-        return {
-            "python_version": sys.version,
-            "platform": platform.platform(),
-            "machine": platform.machine(),
-            "processor": platform.processor(),
-            "hostname": platform.node(),
-        }
+        return dict(_system_info())  # Copy: callers may modify it
 
     def _init_text_logger(self):
         """Initialize human-readable text logger (LEGIBLE principle)"""
@@ -123,13 +197,19 @@ class AuditLogger:
             Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         details : dict, optional
             Additional structured data (parameters, results, etc.)
+
+        Raises
+        ------
+        ValueError
+            If the logger has been closed
         """
-        # Contemporaneous: Real-time timestamping
-        timestamp = datetime.now()
+        if self._events_fh is None:
+            raise ValueError(f"AuditLogger for run {self.run_id} is closed")
 
-        # Create event record
+        # Contemporaneous: Real-time timestamping
+        t_ns = time.time_ns()
         event = {
-            "timestamp": timestamp.isoformat(),
+            "t_ns": t_ns,
             "level": level,
             "message": message,
             "user": self.user,
@@ -141,6 +221,9 @@ class AuditLogger:
 
         # Store event (TRACEABLE principle)
         self.events.append(event)
+        self._level_counts[level] += 1
+        # The persisted record keeps a human-readable time (LEGIBLE)
+        self._events_fh.write(json_line({"timestamp": format_timestamp(t_ns), **event}))
 
         # Write to text log (LEGIBLE principle)
         log_func = getattr(self.text_logger, level.lower(), self.text_logger.info)
@@ -187,30 +270,42 @@ class AuditLogger:
         """
         Save audit trail to JSON file (ENDURING, AVAILABLE principles)
 
+        The events themselves are already in the NDJSON file; it is flushed
+        to disk and the JSON file records the run summary and its name.
+
         Parameters
         ----------
         output_path : str, optional
-            Custom output path (auto-generated if None)
+            Custom output path (auto-generated if None). A ``.json.gz`` or
+            ``.json.zst`` path writes a gzip- or Zstandard-compressed file;
+            the NDJSON event stream itself is never compressed
         """
         if output_path is None:
             output_path = self.log_dir / f"{self.run_id}_audit_trail.json"
         else:
             output_path = Path(output_path)
 
+        if self._events_fh is None:
+            raise ValueError(f"AuditLogger for run {self.run_id} is closed")
+
+        # Make every event logged so far durable before writing the summary
+        self._events_fh.flush()
+        os.fsync(self._events_fh.fileno())
+
         # Calculate runtime
-        end_time = datetime.now()
-        runtime_seconds = (end_time - self.start_time).total_seconds()
+        end_ns = time.time_ns()
+        runtime_seconds = (end_ns - self._start_ns) / 1e9
 
         # Create complete audit record
         audit_record = {
             "run_id": self.run_id,
             "user": self.user,
             "system_info": self.system_info,
-            "start_time": self.start_time.isoformat(),
-            "end_time": end_time.isoformat(),
+            "start_time": format_timestamp(self._start_ns),
+            "end_time": format_timestamp(end_ns),
             "runtime_seconds": runtime_seconds,
             "total_events": len(self.events),
-            "events": self.events,
+            "events_file": self.events_path.name,
             "alcoa_compliance": {
                 "attributable": True,
                 "legible": True,
@@ -226,24 +321,40 @@ class AuditLogger:
         }
 
         # Write JSON
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(audit_record, f, indent=2, default=str)
+        dump_json(audit_record, output_path)
 
         self.log(f"Audit trail saved to {output_path}", level="INFO")
 
         return output_path
 
+    def close(self):
+        """Flush and close the NDJSON event and text log files (safe to call repeatedly)"""
+        if self._events_fh is not None:
+            self._events_finalizer()
+            self._events_fh = None
+
+            for handler in list(self.text_logger.handlers):
+                self.text_logger.removeHandler(handler)
+                handler.close()
+
+    @property
+    def closed(self) -> bool:
+        """Whether close() has been called"""
+        return self._events_fh is None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def get_summary(self) -> Dict[str, Any]:
         """Generate summary statistics for the audit trail"""
-        level_counts = {}
-        for event in self.events:
-            level = event["level"]
-            level_counts[level] = level_counts.get(level, 0) + 1
-
+        # Level counts are maintained by log(), so no rescan of self.events
         return {
             "run_id": self.run_id,
             "total_events": len(self.events),
-            "level_breakdown": level_counts,
-            "start_time": self.start_time.isoformat(),
-            "runtime_seconds": (datetime.now() - self.start_time).total_seconds()
+            "level_breakdown": dict(self._level_counts),
+            "start_time": format_timestamp(self._start_ns),
+            "runtime_seconds": (time.time_ns() - self._start_ns) / 1e9
         }
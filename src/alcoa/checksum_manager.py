@@ -3,12 +3,38 @@ ALCOA++ Checksum Manager
 
 Implements the ENDURING principle through cryptographic file integrity verification.
 All data files are hashed with SHA-256 to ensure data has not been altered.
+BLAKE3 (same 64-hex-digit digest length) is available as an opt-in
+algorithm when the blake3 package is installed.
 """
 
 import hashlib
-import json
+import mmap
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Iterable, Optional, Tuple
+
+from ._jsonio import compression_for, dump_json, load_json
+
+try:
+    from blake3 import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+
+# Read size for streaming files through the hash: large sequential reads
+# keep per-syscall overhead negligible next to hashing
+CHUNK_SIZE = 8 * 1024 * 1024  # 8 MiB
+
+# Files larger than this are memory-mapped and hashed in one update, so the
+# hash reads the page cache directly instead of copying through a buffer;
+# below it the mapping setup costs more than it saves
+MMAP_THRESHOLD = 64 * 1024 * 1024  # 64 MiB
+
+# A file modified this close to its registration can share the recorded
+# mtime on coarse-timestamp filesystems, so verify_file(fast=True) hashes it
+RACY_WINDOW_NS = 2_000_000_000  # 2 s
 
 
 class ChecksumManager:
@@ -17,29 +43,91 @@ class ChecksumManager:
 
     Ensures that data files have not been tampered with or corrupted
     during storage and transmission.
+
+    Can be used as a context manager; pending registrations are written
+    to the checksum file on exit.
     """
 
-    def __init__(self, checksum_file: str = "Results/audit_trail/file_checksums.json"):
+    def __init__(
+        self,
+        checksum_file: str = "Results/audit_trail/file_checksums.json",
+        algorithm: Optional[str] = None,
+        flush_every: Optional[int] = 1
+    ):
         """
         Initialize checksum manager
 
         Parameters
         ----------
         checksum_file : str
-            Path to JSON file storing all checksums
+            Path to JSON file storing all checksums (gzip-compressed if it
+            ends in ``.gz``, Zstandard-compressed if it ends in ``.zst``)
+        algorithm : str, optional
+            "sha256" (FIPS-approved), "blake3" (requires the blake3
+            package; multi-threaded and memory-mapped), or any other
+            hashlib algorithm name. The checksum file records the algorithm
+            it was written with: None (default) uses that one, or sha256
+            for a new file, and a different explicit algorithm raises
+            ValueError
+        flush_every : int, optional
+            Write the checksum file after this many registrations (default:
+            1, after every one). 0 or None defers writing until flush(),
+            close() or the end of a ``with`` block
         """
+        self.flush_every = flush_every
+        self._pending = 0  # Registrations not yet written to checksum_file
         self.checksum_file = Path(checksum_file)
         self.checksum_file.parent.mkdir(parents=True, exist_ok=True)
 
-        # Load existing checksums if available
+        # Load existing checksums if available. The file is
+        # {"algorithm", "files": {path: entry}} with entries
+        # {"checksum", "size", "mtime_ns", "registered_ns"}; older files are
+        # a bare {path: entry} map of unrecorded algorithm, and plain
+        # checksum strings are accepted without stat information
         self.checksums: Dict[str, str] = {}
-        if self.checksum_file.exists():
-            with open(self.checksum_file, 'r', encoding='utf-8') as f:
-                self.checksums = json.load(f)
+        self.file_stats: Dict[str, Tuple[int, int, int]] = {}
+        registry = load_json(self.checksum_file) if self.checksum_file.exists() else {}
+
+        stored_algorithm = None
+        if isinstance(registry.get("files"), dict) and isinstance(registry.get("algorithm"), str):
+            stored_algorithm = registry["algorithm"]
+            registry = registry["files"]
+
+        if algorithm is None:
+            algorithm = stored_algorithm or "sha256"
+        elif stored_algorithm is not None and algorithm != stored_algorithm:
+            raise ValueError(
+                f"{self.checksum_file} holds {stored_algorithm} checksums; "
+                f"cannot use it with algorithm='{algorithm}'"
+            )
+
+        if algorithm == "blake3":
+            if not BLAKE3_AVAILABLE:
+                raise ImportError(
+                    "blake3 is required for BLAKE3 checksums. Install with: pip install blake3"
+                )
+        else:
+            hashlib.new(algorithm)  # ValueError for unknown algorithms
+        self.algorithm = algorithm
+
+        for path, entry in registry.items():
+            if isinstance(entry, str):
+                self.checksums[path] = entry
+            else:
+                self.checksums[path] = entry["checksum"]
+                self.file_stats[path] = (
+                    entry["size"], entry["mtime_ns"], entry["registered_ns"]
+                )
+
+    @staticmethod
+    def _stat(file_path: str) -> Tuple[int, int, int]:
+        """(size, mtime_ns, now_ns) for a file, taken before it is hashed"""
+        st = os.stat(file_path)
+        return st.st_size, st.st_mtime_ns, time.time_ns()
 
     def calculate_checksum(self, file_path: str) -> str:
         """
-        Calculate SHA-256 checksum for a file
+        Calculate checksum for a file with the manager's algorithm
 
         Parameters
         ----------
@@ -49,16 +137,36 @@ class ChecksumManager:
         Returns
         -------
         str
-            Hexadecimal SHA-256 hash
+            Hexadecimal hash (SHA-256 by default)
         """
-        sha256_hash = hashlib.sha256()
+        if self.algorithm == "blake3":
+            # Memory-maps the file and hashes it on all cores
+            file_hash = blake3(max_threads=blake3.AUTO)
+            file_hash.update_mmap(file_path)
+            return file_hash.hexdigest()
+
+        file_hash = hashlib.new(self.algorithm)
+
+        with open(file_path, "rb", buffering=0) as f:
+            if os.fstat(f.fileno()).st_size > MMAP_THRESHOLD:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if hasattr(mm, "madvise"):  # Python >= 3.8, POSIX only
+                        mm.madvise(mmap.MADV_SEQUENTIAL)
+                    with memoryview(mm) as view:
+                        file_hash.update(view)
+                return file_hash.hexdigest()
 
-        with open(file_path, "rb") as f:
-            # Read in chunks to handle large files efficiently
-            for byte_block in iter(lambda: f.read(4096), b""):
-                sha256_hash.update(byte_block)
+            # Stream in CHUNK_SIZE blocks through one reused buffer (unbuffered
+            # file: the block size already amortizes each read)
+            buffer = bytearray(CHUNK_SIZE)
+            view = memoryview(buffer)
+            while True:
+                n = f.readinto(buffer)
+                if not n:
+                    break
+                file_hash.update(view[:n])
 
-        return sha256_hash.hexdigest()
+        return file_hash.hexdigest()
 
     def register_file(self, file_path: str) -> str:
         """
@@ -75,14 +183,50 @@ class ChecksumManager:
             SHA-256 checksum
         """
         file_path = str(Path(file_path).resolve())  # Absolute path
+        stat = self._stat(file_path)
         checksum = self.calculate_checksum(file_path)
 
         self.checksums[file_path] = checksum
-        self._save_checksums()
+        self.file_stats[file_path] = stat
+        self._mark_dirty(1)
 
         return checksum
 
-    def verify_file(self, file_path: str) -> bool:
+    def register_files(self, file_paths: Iterable[str]) -> Dict[str, str]:
+        """
+        Register many files, hashing them concurrently
+
+        hashlib (and blake3) release the GIL while hashing, so files are
+        hashed on a thread pool; the checksum file is written at most once
+        for the whole batch instead of once per file.
+
+        Parameters
+        ----------
+        file_paths : Iterable[str]
+            Paths of files to register
+
+        Returns
+        -------
+        Dict[str, str]
+            Checksum per absolute file path
+        """
+        resolved = [str(Path(p).resolve()) for p in file_paths]
+        if not resolved:
+            return {}
+
+        stats = [self._stat(p) for p in resolved]
+
+        workers = min(len(resolved), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            checksums = dict(zip(resolved, executor.map(self.calculate_checksum, resolved)))
+
+        self.checksums.update(checksums)
+        self.file_stats.update(zip(resolved, stats))
+        self._mark_dirty(len(resolved))
+
+        return checksums
+
+    def verify_file(self, file_path: str, fast: bool = False) -> bool:
         """
         Verify file integrity against stored checksum
 
@@ -90,6 +234,12 @@ class ChecksumManager:
         ----------
         file_path : str
             Path to file to verify
+        fast : bool
+            If True, a file whose size and mtime_ns still match the values
+            recorded at registration is reported valid without hashing
+            (unless it was modified within RACY_WINDOW_NS of registering).
+            This trusts file timestamps; leave False (default) to always
+            hash, which also catches edits that preserve the mtime
 
         Returns
         -------
@@ -106,15 +256,64 @@ class ChecksumManager:
         if file_path not in self.checksums:
             raise ValueError(f"No checksum found for {file_path}. Register file first.")
 
+        if fast and file_path in self.file_stats:
+            size, mtime_ns, registered_ns = self.file_stats[file_path]
+            st = os.stat(file_path)
+            if (
+                st.st_size == size
+                and st.st_mtime_ns == mtime_ns
+                and mtime_ns < registered_ns - RACY_WINDOW_NS
+            ):
+                return True
+
         current_checksum = self.calculate_checksum(file_path)
         stored_checksum = self.checksums[file_path]
 
         return current_checksum == stored_checksum
 
+    def _mark_dirty(self, count: int):
+        """Record ``count`` new registrations and write if flush_every is reached"""
+        self._pending += count
+        if self.flush_every and self._pending >= self.flush_every:
+            self.flush()
+
+    def flush(self):
+        """Write pending registrations to the checksum file"""
+        if self._pending:
+            self._save_checksums()
+            self._pending = 0
+
+    def close(self):
+        """Flush pending registrations (the manager stays usable)"""
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.flush()
+
     def _save_checksums(self):
-        """Save checksums to JSON file"""
-        with open(self.checksum_file, 'w', encoding='utf-8') as f:
-            json.dump(self.checksums, f, indent=2)
+        """Save checksums to JSON file atomically (write temp file, then rename)"""
+        files = {}
+        for path, checksum in self.checksums.items():
+            if path in self.file_stats:
+                size, mtime_ns, registered_ns = self.file_stats[path]
+                files[path] = {
+                    "checksum": checksum,
+                    "size": size,
+                    "mtime_ns": mtime_ns,
+                    "registered_ns": registered_ns,
+                }
+            else:
+                files[path] = checksum
+        registry = {"algorithm": self.algorithm, "files": files}
+
+        tmp_path = self.checksum_file.with_name(
+            f".{self.checksum_file.name}.{os.getpid()}.tmp"
+        )
+        dump_json(registry, tmp_path, compression=compression_for(self.checksum_file))
+        os.replace(tmp_path, self.checksum_file)
 
     def get_checksum(self, file_path: str) -> Optional[str]:
         """
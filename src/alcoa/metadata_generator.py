@@ -5,11 +5,12 @@ Implements COMPLETE, AVAILABLE, and LEGIBLE principles through structured metada
 Generates comprehensive metadata for all pipeline outputs.
 """
 
-import json
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+from ._jsonio import dump_json
+
 
 class MetadataGenerator:
     """
@@ -96,8 +97,7 @@ class MetadataGenerator:
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(metadata, f, indent=2, default=str)
+        dump_json(metadata, output_path)
 
     @staticmethod
     def generate_run_metadata(
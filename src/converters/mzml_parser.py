@@ -37,9 +37,9 @@ class Spectrum:
     retention_time : float
         Retention time in seconds
     mz_array : np.ndarray
-        Fragment ion m/z values
+        Fragment ion m/z values (contiguous float64)
     intensity_array : np.ndarray
-        Fragment ion intensities
+        Fragment ion intensities (contiguous float32)
     """
 
     def __init__(self, spectrum_dict: Dict):
@@ -67,9 +67,14 @@ class Spectrum:
         scan_list = spectrum_dict.get('scanList', {}).get('scan', [{}])[0]
         self.retention_time = scan_list.get('scan start time', 0.0)
 
-        # Fragment ions
-        self.mz_array = spectrum_dict.get('m/z array', np.array([]))
-        self.intensity_array = spectrum_dict.get('intensity array', np.array([]))
+        # Fragment ions: m/z keeps full precision for ppm matching (no copy if
+        # already contiguous float64); intensities only need single precision
+        self.mz_array = np.ascontiguousarray(
+            spectrum_dict.get('m/z array', ()), dtype=np.float64
+        )
+        self.intensity_array = np.ascontiguousarray(
+            spectrum_dict.get('intensity array', ()), dtype=np.float32
+        )
 
     def __repr__(self):
         return (
@@ -14,8 +14,8 @@ Status: In Development
 """
 
 from .fasta_parser import FastaParser, Peptide, Protein
-from .glycan_database import GlycanDatabase, Glycan, GlycanType
-from .candidate_generator import CandidateGenerator, GlycopeptideCandidate
+from .glycan_database import GlycanDatabase, Glycan, GlycanType, get_default_glycan_db
+from .candidate_generator import CandidateGenerator, CandidateView, GlycopeptideCandidate
 
 __all__ = [
     "FastaParser",
@@ -24,6 +24,8 @@ __all__ = [
     "GlycanDatabase",
     "Glycan",
     "GlycanType",
+    "get_default_glycan_db",
     "CandidateGenerator",
+    "CandidateView",
     "GlycopeptideCandidate",
 ]
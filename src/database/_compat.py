@@ -0,0 +1,10 @@
+"""
+Compatibility Helpers
+
+Version-dependent keyword arguments shared by the database modules.
+"""
+
+import sys
+
+# dataclass(slots=True) needs Python 3.10+; on 3.9 the classes keep __dict__
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
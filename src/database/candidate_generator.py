@@ -17,18 +17,96 @@ Phase: 2 (Week 2)
 """
 
 import numpy as np
-from typing import List, Dict, Tuple
+from collections.abc import Sequence
+from typing import List, Dict, Optional, Tuple, Union
 from dataclasses import dataclass
 
+from ._compat import DATACLASS_SLOTS
 from .fasta_parser import Peptide
 from .glycan_database import Glycan
 
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 
 # Physical constants
 PROTON_MASS = 1.007276  # Da
 
+# One row per matched candidate: index into the generator's glycosylated
+# peptides, index into its glycans, theoretical mass (Da) and ppm error
+_CAND_DTYPE = np.dtype([
+    ('pep', np.int32),
+    ('gly', np.int32),
+    ('mass', np.float64),
+    ('ppm', np.float64),
+])
+
+
+def _window_numpy(masses: np.ndarray, lo: float, hi: float) -> Tuple[int, int]:
+    """Index range [i0, i1) of sorted ``masses`` within [lo, hi] (NumPy path)"""
+    i0 = np.searchsorted(masses, lo, side='left')
+    i1 = np.searchsorted(masses, hi, side='right')
+    return int(i0), int(i1)
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _window(masses, lo, hi):
+        """Index range [i0, i1) of sorted ``masses`` within [lo, hi] (JIT path)"""
+        i0 = np.searchsorted(masses, lo, side='left')
+        i1 = np.searchsorted(masses, hi, side='right')
+        return i0, i1
+else:
+    _window = _window_numpy
+
+
+def _batch_windows_numpy(
+    masses: np.ndarray, lo: np.ndarray, hi: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Index ranges [i0, i1) of sorted ``masses`` for arrays of bounds (NumPy path)"""
+    return (
+        np.searchsorted(masses, lo, side='left'),
+        np.searchsorted(masses, hi, side='right')
+    )
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def _batch_windows(masses, lo, hi):
+        """Index ranges [i0, i1) of sorted ``masses`` for arrays of bounds (JIT path)"""
+        n = lo.shape[0]
+        out_start = np.empty(n, dtype=np.int64)
+        out_end = np.empty(n, dtype=np.int64)
+        for k in prange(n):
+            out_start[k] = np.searchsorted(masses, lo[k], side='left')
+            out_end[k] = np.searchsorted(masses, hi[k], side='right')
+        return out_start, out_end
+else:
+    _batch_windows = _batch_windows_numpy
+
+
+_KERNELS_WARM = not NUMBA_AVAILABLE
+
+
+def _warm_kernels():
+    """
+    Compile (or load from the on-disk cache) the JIT kernels once
+
+    Called from CandidateGenerator.__init__ rather than at import, so
+    FASTA/glycan-only users never pay for it and the first search does
+    not pay the JIT latency.
+    """
+    global _KERNELS_WARM
+    if not _KERNELS_WARM:
+        _window(np.zeros(1), 0.0, 0.0)
+        _batch_windows(np.zeros(1), np.zeros(1), np.zeros(1))
+        _KERNELS_WARM = True
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class GlycopeptideCandidate:
     """
     Represents a glycopeptide candidate match
@@ -69,6 +147,94 @@ class GlycopeptideCandidate:
         )
 
 
+class CandidateView(Sequence):
+    """
+    Read-only sequence of glycopeptide candidates backed by a record array
+
+    Matches are held as rows of a NumPy structured array and a
+    GlycopeptideCandidate is only built the first time its position is
+    accessed; later accesses return the same object. Slicing returns a
+    list of candidates, like slicing a list would.
+
+    Unlike the list generate_candidates used to return, a view has no
+    append, sort or ``+``; use ``list(view)`` for a mutable list.
+
+    Parameters
+    ----------
+    records : np.ndarray
+        Structured array with fields pep, gly, mass and ppm
+    peptides : List[Peptide]
+        Peptides referenced by the pep field
+    glycans : List[Glycan]
+        Glycans referenced by the gly field
+    observed_mz : float
+        Observed precursor m/z shared by all candidates
+    charge : int
+        Precursor charge state shared by all candidates
+    """
+
+    __slots__ = ('records', 'peptides', 'glycans', 'observed_mz', 'charge', '_cache')
+
+    def __init__(
+        self,
+        records: np.ndarray,
+        peptides: List[Peptide],
+        glycans: List[Glycan],
+        observed_mz: float,
+        charge: int
+    ):
+        self.records = records
+        self.peptides = peptides
+        self.glycans = glycans
+        self.observed_mz = observed_mz
+        self.charge = charge
+        self._cache: List[Optional[GlycopeptideCandidate]] = [None] * len(records)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[GlycopeptideCandidate, List[GlycopeptideCandidate]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        n = len(self)
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("candidate index out of range")
+
+        candidate = self._cache[index]
+        if candidate is None:
+            candidate = self._materialize(index)
+            self._cache[index] = candidate
+        return candidate
+
+    def _materialize(self, index: int) -> GlycopeptideCandidate:
+        """Build the GlycopeptideCandidate for one record"""
+        row = self.records[index]
+        peptide = self.peptides[row['pep']]
+        ppm_error = float(row['ppm'])
+
+        # Use first glycosylation site (could be extended to try all sites)
+        glyco_site = peptide.glycosylation_sites[0] if peptide.glycosylation_sites else 0
+
+        return GlycopeptideCandidate(
+            peptide=peptide,
+            glycan=self.glycans[row['gly']],
+            theoretical_mass=float(row['mass']),
+            observed_mz=self.observed_mz,
+            charge=self.charge,
+            ppm_error=ppm_error,
+            glycosylation_site=glyco_site,
+            score=abs(ppm_error)  # Lower is better
+        )
+
+    def __repr__(self):
+        return f"CandidateView({len(self)} candidates, m/z={self.observed_mz}, z={self.charge})"
+
+
 class CandidateGenerator:
     """
     Generate glycopeptide candidates by mass matching
@@ -93,32 +259,97 @@ class CandidateGenerator:
 
     def __init__(self, peptides: List[Peptide], glycans: List[Glycan]):
         """Initialize candidate generator"""
+        _warm_kernels()
+
         self.peptides = peptides
         self.glycans = glycans
 
-        # Pre-compute all possible glycopeptide masses for faster matching
-        self._glycopeptide_masses: List[Tuple[float, Peptide, Glycan]] = []
+        self._peptide_masses = np.fromiter(
+            (p.mass for p in peptides), dtype=np.float64, count=len(peptides)
+        )
+        self._glycan_masses = np.fromiter(
+            (g.mass for g in glycans), dtype=np.float64, count=len(glycans)
+        )
+        self._has_site = np.fromiter(
+            (p.has_glycosylation_site for p in peptides), dtype=bool, count=len(peptides)
+        )
+
+        # Pre-compute all possible glycopeptide masses for faster matching,
+        # stored as parallel arrays sorted by mass
+        self._glyco_peptides: List[Peptide] = []
+        self._masses_sorted = np.zeros(0)
+        self._pep_idx = np.zeros(0, dtype=np.int32)
+        self._gly_idx = np.zeros(0, dtype=np.int32)
         self._build_mass_index()
 
+        # Index over every peptide, built on the first glyco_only=False search
+        self._all_index = None
+
     def _build_mass_index(self):
         """
         Pre-compute all glycopeptide masses
 
         This creates an index for binary search during candidate generation.
-        Only includes peptides with glycosylation sites.
+        Only includes peptides with glycosylation sites. Entry i of the index
+        pairs self._glyco_peptides[self._pep_idx[i]] with
+        self.glycans[self._gly_idx[i]] at mass self._masses_sorted[i].
         """
-        self._glycopeptide_masses = []
-
         # Only consider peptides with glycosylation sites
-        glyco_peptides = [p for p in self.peptides if p.has_glycosylation_site]
+        glyco_rows = np.flatnonzero(self._has_site)
+        self._glyco_peptides = [self.peptides[i] for i in glyco_rows.tolist()]
+
+        self._masses_sorted, self._pep_idx, self._gly_idx = self._sorted_mass_index(
+            self._peptide_masses[glyco_rows]
+        )
+
+    def _sorted_mass_index(
+        self, peptide_masses: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Sort every peptide x glycan mass for binary search
+
+        Parameters
+        ----------
+        peptide_masses : np.ndarray
+            Masses of the peptides to pair with self.glycans
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray, np.ndarray]
+            Sorted masses, peptide index and glycan index per entry
+        """
+        # All peptide x glycan masses, peptide-major
+        masses = np.add.outer(peptide_masses, self._glycan_masses).ravel()
+
+        # Sort by mass for binary search (stable: ties keep peptide-major order)
+        order = np.argsort(masses, kind='stable')
+        pep_idx, gly_idx = np.divmod(order, max(len(self.glycans), 1))
+
+        return masses[order], pep_idx.astype(np.int32), gly_idx.astype(np.int32)
+
+    def _select_index(
+        self, glyco_only: bool
+    ) -> Tuple[List[Peptide], np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Mass index to search
+
+        Parameters
+        ----------
+        glyco_only : bool
+            Use the index of peptides with a glycosylation site; otherwise
+            the index of all peptides (built on first use)
 
-        for peptide in glyco_peptides:
-            for glycan in self.glycans:
-                total_mass = peptide.mass + glycan.mass
-                self._glycopeptide_masses.append((total_mass, peptide, glycan))
+        Returns
+        -------
+        Tuple[List[Peptide], np.ndarray, np.ndarray, np.ndarray]
+            Indexed peptides, sorted masses, peptide index and glycan index
+        """
+        if glyco_only:
+            return self._glyco_peptides, self._masses_sorted, self._pep_idx, self._gly_idx
 
-        # Sort by mass for binary search
-        self._glycopeptide_masses.sort(key=lambda x: x[0])
+        if self._all_index is None:
+            self._all_index = (self.peptides,) + self._sorted_mass_index(self._peptide_masses)
+        return self._all_index
 
     def calculate_neutral_mass(self, precursor_mz: float, charge: int) -> float:
         """
@@ -160,13 +391,32 @@ class CandidateGenerator:
         """
         return ((observed_mass - theoretical_mass) / theoretical_mass) * 1e6
 
+    def _ppm_errors_batch(self, hit_masses: np.ndarray, neutral_mass: float) -> np.ndarray:
+        """
+        Calculate ppm errors for an array of theoretical masses
+
+        Parameters
+        ----------
+        hit_masses : np.ndarray
+            Theoretical masses (Da)
+        neutral_mass : float
+            Observed neutral mass (Da)
+
+        Returns
+        -------
+        np.ndarray
+            PPM error per theoretical mass
+        """
+        return ((neutral_mass - hit_masses) / hit_masses) * 1e6
+
     def generate_candidates(
         self,
         precursor_mz: float,
         charge: int,
         tolerance_ppm: float = 10.0,
-        max_candidates: int = 5000
-    ) -> List[GlycopeptideCandidate]:
+        max_candidates: int = 5000,
+        glyco_only: bool = True
+    ) -> CandidateView:
         """
         Generate glycopeptide candidates for a precursor
 
@@ -180,11 +430,17 @@ class CandidateGenerator:
             Mass tolerance in ppm (default: 10.0)
         max_candidates : int
             Maximum number of candidates to return (default: 5000)
+        glyco_only : bool
+            Only match peptides with an N-glycosylation motif (default: True).
+            Results then need no filter_by_glycosylation_sites pass
 
         Returns
         -------
-        List[GlycopeptideCandidate]
-            Matched candidates, sorted by ppm error
+        CandidateView
+            Matched candidates, sorted by ppm error. Candidate objects are
+            created lazily on access; the raw matches are in ``.records``.
+            This is a read-only sequence, not a list: use ``list(...)`` to
+            append, sort or concatenate candidates
         """
         # Calculate neutral mass
         observed_mass = self.calculate_neutral_mass(precursor_mz, charge)
@@ -192,38 +448,132 @@ class CandidateGenerator:
         # Calculate mass window
         mass_tolerance_da = (tolerance_ppm / 1e6) * observed_mass
 
-        # Find candidates within tolerance
-        candidates = []
+        peptides, masses_sorted, pep_idx, gly_idx = self._select_index(glyco_only)
+
+        # Binary search the sorted index for the tolerance window
+        i0, i1 = _window(
+            masses_sorted,
+            observed_mass - mass_tolerance_da,
+            observed_mass + mass_tolerance_da
+        )
+
+        return self._window_candidates(
+            (peptides, masses_sorted, pep_idx, gly_idx), i0, i1,
+            observed_mass, mass_tolerance_da, precursor_mz, charge, max_candidates
+        )
+
+    def generate_candidates_batch(
+        self,
+        precursor_mzs: np.ndarray,
+        charges: np.ndarray,
+        tolerance_ppm: float = 10.0,
+        max_candidates: int = 5000,
+        glyco_only: bool = True
+    ) -> List[CandidateView]:
+        """
+        Generate glycopeptide candidates for many precursors
+
+        The tolerance windows of all precursors are located in one call
+        (parallel over precursors when Numba is available); each result is
+        the same as generate_candidates would return for that precursor.
+
+        Parameters
+        ----------
+        precursor_mzs : np.ndarray
+            Observed precursor m/z values
+        charges : np.ndarray
+            Precursor charge states, one per m/z
+        tolerance_ppm : float
+            Mass tolerance in ppm (default: 10.0)
+        max_candidates : int
+            Maximum number of candidates per precursor (default: 5000)
+        glyco_only : bool
+            Only match peptides with an N-glycosylation motif (default: True)
+
+        Returns
+        -------
+        List[CandidateView]
+            Candidates per precursor, in input order
+        """
+        precursor_mzs = np.asarray(precursor_mzs, dtype=np.float64)
+        charges = np.asarray(charges)
+        if precursor_mzs.shape != charges.shape:
+            raise ValueError("precursor_mzs and charges must have the same length")
+
+        index = self._select_index(glyco_only)
+
+        observed_masses = self.calculate_neutral_mass(precursor_mzs, charges)
+        tolerances_da = (tolerance_ppm / 1e6) * observed_masses
+        starts, ends = _batch_windows(
+            index[1], observed_masses - tolerances_da, observed_masses + tolerances_da
+        )
+
+        return [
+            self._window_candidates(index, i0, i1, mass, tol, mz, z, max_candidates)
+            for i0, i1, mass, tol, mz, z in zip(
+                starts.tolist(), ends.tolist(), observed_masses.tolist(),
+                tolerances_da.tolist(), precursor_mzs.tolist(), charges.tolist()
+            )
+        ]
+
+    def _window_candidates(
+        self,
+        index: Tuple[List[Peptide], np.ndarray, np.ndarray, np.ndarray],
+        i0: int,
+        i1: int,
+        observed_mass: float,
+        mass_tolerance_da: float,
+        precursor_mz: float,
+        charge: int,
+        max_candidates: int
+    ) -> CandidateView:
+        """
+        Candidates from one tolerance window of a mass index
+
+        Parameters
+        ----------
+        index : Tuple[List[Peptide], np.ndarray, np.ndarray, np.ndarray]
+            Mass index from _select_index
+        i0, i1 : int
+            Window [i0, i1) of the sorted masses
+        observed_mass : float
+            Observed neutral mass (Da)
+        mass_tolerance_da : float
+            Mass tolerance (Da)
+        precursor_mz : float
+            Observed precursor m/z
+        charge : int
+            Precursor charge state
+        max_candidates : int
+            Maximum number of candidates to return
 
-        for theoretical_mass, peptide, glycan in self._glycopeptide_masses:
-            # Check if within tolerance
-            mass_diff = abs(theoretical_mass - observed_mass)
-            if mass_diff <= mass_tolerance_da:
-                # Calculate ppm error
-                ppm_error = self.calculate_ppm_error(theoretical_mass, observed_mass)
+        Returns
+        -------
+        CandidateView
+            Matched candidates, sorted by ppm error
+        """
+        peptides, masses_sorted, pep_idx, gly_idx = index
 
-                # Create candidate
-                # Use first glycosylation site (could be extended to try all sites)
-                glyco_site = peptide.glycosylation_sites[0] if peptide.glycosylation_sites else 0
+        if i1 <= i0:
+            return CandidateView(
+                np.zeros(0, dtype=_CAND_DTYPE), peptides, self.glycans, precursor_mz, charge
+            )
 
-                candidate = GlycopeptideCandidate(
-                    peptide=peptide,
-                    glycan=glycan,
-                    theoretical_mass=theoretical_mass,
-                    observed_mz=precursor_mz,
-                    charge=charge,
-                    ppm_error=ppm_error,
-                    glycosylation_site=glyco_site,
-                    score=abs(ppm_error)  # Lower is better
-                )
+        # Exact tolerance check and ppm errors over the window in one pass
+        hit_masses = masses_sorted[i0:i1]
+        ppm_errors = self._ppm_errors_batch(hit_masses, observed_mass)
+        hits = np.flatnonzero(np.abs(hit_masses - observed_mass) <= mass_tolerance_da)
 
-                candidates.append(candidate)
+        # Sort by ppm error (best matches first) and limit to max_candidates
+        hits = hits[np.argsort(np.abs(ppm_errors[hits]), kind='stable')][:max_candidates]
 
-        # Sort by ppm error (best matches first)
-        candidates.sort(key=lambda c: abs(c.ppm_error))
+        records = np.empty(len(hits), dtype=_CAND_DTYPE)
+        records['pep'] = pep_idx[hits + i0]
+        records['gly'] = gly_idx[hits + i0]
+        records['mass'] = hit_masses[hits]
+        records['ppm'] = ppm_errors[hits]
 
-        # Limit to max_candidates
-        return candidates[:max_candidates]
+        return CandidateView(records, peptides, self.glycans, precursor_mz, charge)
 
     def filter_by_glycosylation_sites(
         self,
@@ -232,6 +582,9 @@ class CandidateGenerator:
         """
         Filter candidates to ensure glycosylation site is valid
 
+        Candidates from generate_candidates(glyco_only=True) already satisfy
+        this and do not need filtering.
+
         Parameters
         ----------
         candidates : List[GlycopeptideCandidate]
@@ -244,21 +597,25 @@ class CandidateGenerator:
         """
         return [c for c in candidates if c.peptide.has_glycosylation_site]
 
-    def get_statistics(self, candidates: List[GlycopeptideCandidate]) -> Dict:
+    def get_statistics(
+        self,
+        candidates: Union[CandidateView, List[GlycopeptideCandidate]]
+    ) -> Dict:
         """
         Get statistics about candidates
 
         Parameters
         ----------
-        candidates : List[GlycopeptideCandidate]
-            Candidates to analyze
+        candidates : CandidateView or List[GlycopeptideCandidate]
+            Candidates to analyze. A CandidateView is summarized from its
+            record array without building candidate objects
 
         Returns
         -------
         dict
             Statistics
         """
-        if not candidates:
+        if len(candidates) == 0:
             return {
                 "total_candidates": 0,
                 "unique_peptides": 0,
@@ -267,15 +624,28 @@ class CandidateGenerator:
                 "average_ppm_error": 0,
             }
 
-        ppm_errors = [abs(c.ppm_error) for c in candidates]
-        unique_peptides = set(c.peptide.sequence for c in candidates)
-        unique_glycans = set(c.glycan.composition for c in candidates)
+        if isinstance(candidates, CandidateView):
+            # Read the record array directly instead of materializing candidates
+            records = candidates.records
+            ppm_errors = np.abs(records['ppm'])
+            unique_peptides = set(
+                candidates.peptides[i].sequence for i in np.unique(records['pep']).tolist()
+            )
+            unique_glycans = set(
+                candidates.glycans[i].composition for i in np.unique(records['gly']).tolist()
+            )
+        else:
+            ppm_errors = np.abs(np.fromiter(
+                (c.ppm_error for c in candidates), dtype=np.float64, count=len(candidates)
+            ))
+            unique_peptides = set(c.peptide.sequence for c in candidates)
+            unique_glycans = set(c.glycan.composition for c in candidates)
 
         return {
             "total_candidates": len(candidates),
             "unique_peptides": len(unique_peptides),
             "unique_glycans": len(unique_glycans),
-            "ppm_error_range": (min(ppm_errors), max(ppm_errors)),
+            "ppm_error_range": (float(ppm_errors.min()), float(ppm_errors.max())),
             "average_ppm_error": np.mean(ppm_errors),
             "median_ppm_error": np.median(ppm_errors),
         }
@@ -289,10 +659,14 @@ class CandidateGenerator:
         dict
             Index statistics
         """
+        index_bytes = (
+            self._masses_sorted.nbytes + self._pep_idx.nbytes + self._gly_idx.nbytes
+        )
+
         return {
-            "total_glycopeptides": len(self._glycopeptide_masses),
+            "total_glycopeptides": len(self._masses_sorted),
             "total_peptides": len(self.peptides),
-            "glyco_peptides": sum(1 for p in self.peptides if p.has_glycosylation_site),
+            "glyco_peptides": len(self._glyco_peptides),
             "total_glycans": len(self.glycans),
-            "memory_estimate_mb": len(self._glycopeptide_masses) * 32 / 1024 / 1024,  # Rough estimate
+            "memory_estimate_mb": index_bytes / 1024 / 1024,
         }
@@ -16,11 +16,17 @@ Date: 2025-10-21
 Phase: 2 (Week 2)
 """
 
+import os
 import re
+import numpy as np
+from bisect import bisect_left
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
 
+from ._compat import DATACLASS_SLOTS
+
 try:
     from Bio import SeqIO
     BIOPYTHON_AVAILABLE = True
@@ -37,11 +43,34 @@ AA_MASSES = {
     'T': 101.04768, 'V': 99.06841,  'W': 186.07931, 'Y': 163.06333,
 }
 
+# Unknown amino acids are assigned an average residue mass
+UNKNOWN_AA_MASS = 110.0
+
+# Residue mass lookup indexed by ASCII code
+_AA_MASS_LUT = np.full(256, UNKNOWN_AA_MASS)
+for _aa, _mass in AA_MASSES.items():
+    _AA_MASS_LUT[ord(_aa)] = _mass
+
+# Same table as Python floats, for summing short sequences without NumPy
+# call overhead (indexing an array.array would box a new float per residue)
+_AA_MASS_TABLE = _AA_MASS_LUT.tolist()
+
 # Water mass (added to peptide mass)
 WATER_MASS = 18.01056
 
 
-@dataclass
+def _sequence_mass(codes: bytes) -> float:
+    """
+    Monoisotopic peptide mass from ASCII residue codes
+
+    Every peptide mass goes through this one left-to-right summation, so a
+    digested peptide and the same Peptide built directly compare equal.
+    """
+    # N-terminus H + C-terminus OH; unknown amino acids use average mass
+    return WATER_MASS + sum(map(_AA_MASS_TABLE.__getitem__, codes))
+
+
+@dataclass(**DATACLASS_SLOTS)
 class Protein:
     """
     Represents a protein from FASTA file
@@ -63,7 +92,7 @@ class Protein:
         return f"Protein(id='{self.id}', length={len(self.sequence)})"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Peptide:
     """
     Represents a peptide from in-silico digestion
@@ -111,16 +140,7 @@ class Peptide:
         float
             Monoisotopic mass in Daltons
         """
-        mass = WATER_MASS  # N-terminus H + C-terminus OH
-
-        for aa in self.sequence:
-            if aa in AA_MASSES:
-                mass += AA_MASSES[aa]
-            else:
-                # Unknown amino acid - use average mass
-                mass += 110.0
-
-        return mass
+        return _sequence_mass(self.sequence.encode('ascii', 'replace'))
 
     def __repr__(self):
         return f"Peptide(seq='{self.sequence}', mass={self.mass:.2f}, glyco={self.has_glycosylation_site})"
@@ -156,6 +176,13 @@ class FastaParser:
     # N-glycosylation motif: N-X-S/T where X ≠ P
     GLYCOSYLATION_MOTIF = r'N[^P][ST]'
 
+    # ENZYMES compiled once; digestion scans each protein with these
+    _ENZYME_PATTERNS = {name: re.compile(pattern) for name, pattern in ENZYMES.items()}
+
+    # GLYCOSYLATION_MOTIF compiled once, inside a zero-width lookahead so
+    # overlapping sequons such as "NNST" report every N; group 1 spans the motif
+    _MOTIF_PATTERN = re.compile(f'(?=({GLYCOSYLATION_MOTIF}))')
+
     def __init__(self, fasta_file_path: str):
         """Initialize FASTA parser"""
         if not BIOPYTHON_AVAILABLE:
@@ -170,16 +197,42 @@ class FastaParser:
 
         self.proteins: List[Protein] = []
 
+        # File state and cached proteins that self.proteins was parsed from
+        self._parsed_stamp: Optional[Tuple[int, int]] = None
+        self._parsed_proteins: Tuple[Protein, ...] = ()
+
     def parse(self) -> List[Protein]:
         """
         Parse FASTA file and extract proteins
 
+        Results are cached per file path and modification state (see
+        clear_cache()); each call returns new Protein objects, so
+        self.proteins and its proteins may be replaced or edited freely
+        and digest() then works on the edited list.
+
         Returns
         -------
         List[Protein]
             List of parsed proteins
         """
-        self.proteins = []
+        self._parsed_stamp = _file_stamp(self.fasta_file_path)
+        self._parsed_proteins = _parse_cached(str(self.fasta_file_path), self._parsed_stamp)
+        self.proteins = [
+            Protein(id=p.id, description=p.description, sequence=p.sequence)
+            for p in self._parsed_proteins
+        ]
+
+        return self.proteins
+
+    @staticmethod
+    def clear_cache():
+        """Drop the parse and digest results cached for every FASTA file"""
+        _parse_cached.cache_clear()
+        _digest_cached.cache_clear()
+
+    def _read_proteins(self) -> List[Protein]:
+        """Read proteins from the FASTA file (uncached)"""
+        proteins = []
 
         with open(self.fasta_file_path, 'r') as handle:
             for record in SeqIO.parse(handle, "fasta"):
@@ -188,9 +241,9 @@ class FastaParser:
                     description=record.description,
                     sequence=str(record.seq)
                 )
-                self.proteins.append(protein)
+                proteins.append(protein)
 
-        return self.proteins
+        return proteins
 
     def digest(
         self,
@@ -217,7 +270,7 @@ class FastaParser:
         Returns
         -------
         List[Peptide]
-            List of digested peptides
+            List of digested peptides (new objects on every call)
         """
         if not self.proteins:
             self.parse()
@@ -225,7 +278,40 @@ class FastaParser:
         if enzyme not in self.ENZYMES:
             raise ValueError(f"Unknown enzyme: {enzyme}. Options: {list(self.ENZYMES.keys())}")
 
-        cleavage_pattern = self.ENZYMES[enzyme]
+        # self.proteins is still the parse of the file as it is on disk:
+        # copy the cached digest (keyed on the parser class, so subclasses
+        # with their own ENZYMES or digestion rules get their own entries)
+        if self._proteins_unchanged():
+            cached = _digest_cached(
+                type(self), str(self.fasta_file_path), self._parsed_stamp,
+                enzyme, missed_cleavages, min_length, max_length
+            )
+            return [_copy_peptide(peptide) for peptide in cached]
+
+        return self._digest_proteins(enzyme, missed_cleavages, min_length, max_length)
+
+    def _proteins_unchanged(self) -> bool:
+        """Whether self.proteins still equals the cached parse of the current file"""
+        # Copies share their strings with the cache, so equal proteins
+        # compare by identity without scanning the sequences
+        return (
+            self._parsed_stamp is not None
+            and self.proteins == list(self._parsed_proteins)
+            and _file_stamp(self.fasta_file_path) == self._parsed_stamp
+        )
+
+    def _digest_proteins(
+        self,
+        enzyme: str,
+        missed_cleavages: int,
+        min_length: int,
+        max_length: int
+    ) -> List[Peptide]:
+        """Digest self.proteins (uncached); arguments as for digest()"""
+        # Precompiled rule unless a subclass overrides this enzyme's pattern
+        cleavage_pattern = self._ENZYME_PATTERNS.get(enzyme)
+        if cleavage_pattern is None or cleavage_pattern.pattern != self.ENZYMES[enzyme]:
+            cleavage_pattern = re.compile(self.ENZYMES[enzyme])
         all_peptides = []
 
         for protein in self.proteins:
@@ -240,10 +326,17 @@ class FastaParser:
 
         return all_peptides
 
+    def _motif_pattern(self) -> re.Pattern:
+        """Compiled GLYCOSYLATION_MOTIF lookahead (recompiled if a subclass overrides it)"""
+        pattern = self._MOTIF_PATTERN
+        if pattern.pattern != f'(?=({self.GLYCOSYLATION_MOTIF}))':
+            pattern = re.compile(f'(?=({self.GLYCOSYLATION_MOTIF}))')
+        return pattern
+
     def _digest_protein(
         self,
         protein: Protein,
-        cleavage_pattern: str,
+        cleavage_pattern: re.Pattern,
         missed_cleavages: int,
         min_length: int,
         max_length: int
@@ -255,8 +348,8 @@ class FastaParser:
         ----------
         protein : Protein
             Protein to digest
-        cleavage_pattern : str
-            Regular expression for cleavage sites
+        cleavage_pattern : re.Pattern
+            Compiled regular expression for cleavage sites
         missed_cleavages : int
             Maximum missed cleavages
         min_length : int
@@ -272,33 +365,47 @@ class FastaParser:
         sequence = protein.sequence
         peptides = []
 
-        # Find all cleavage sites
-        cleavage_sites = [0]  # Start of sequence
-        for match in re.finditer(cleavage_pattern, sequence):
-            cleavage_sites.append(match.end())
-        cleavage_sites.append(len(sequence))  # End of sequence
+        # Encoded once; each peptide mass sums its slice of the codes
+        codes = sequence.encode('ascii', 'replace')
+
+        # Find all cleavage sites in one regex pass
+        cleavage_sites = [0] + [m.end() for m in cleavage_pattern.finditer(sequence)]
+        cleavage_sites.append(len(sequence))
+
+        # Sequon positions and ends in the protein; a peptide [start, end)
+        # keeps those with the whole motif inside it
+        sequons = [(m.start(), m.end(1)) for m in self._motif_pattern().finditer(sequence)]
+        sequon_sites = [pos for pos, _ in sequons]
 
         # Generate peptides with missed cleavages
         for i in range(len(cleavage_sites) - 1):
+            start = cleavage_sites[i]
             for j in range(i + 1, min(i + missed_cleavages + 2, len(cleavage_sites))):
-                start = cleavage_sites[i]
                 end = cleavage_sites[j]
-                peptide_seq = sequence[start:end]
+                length = end - start
 
-                # Apply length filters
-                if len(peptide_seq) < min_length or len(peptide_seq) > max_length:
+                # Apply length filters; later ends are only longer
+                if length > max_length:
+                    break
+                if length < min_length:
                     continue
 
-                # Check for N-glycosylation motif
-                has_glyco, glyco_sites = self._has_glycosylation_motif(peptide_seq)
+                # N-glycosylation motif sites, relative to the peptide
+                glyco_sites = [
+                    pos - start for pos, motif_end in sequons[
+                        bisect_left(sequon_sites, start):bisect_left(sequon_sites, end)
+                    ]
+                    if motif_end <= end
+                ]
 
                 peptide = Peptide(
-                    sequence=peptide_seq,
+                    sequence=sequence[start:end],
                     protein_id=protein.id,
                     start_position=start + 1,  # 1-indexed
                     end_position=end,
                     missed_cleavages=j - i - 1,
-                    has_glycosylation_site=has_glyco,
+                    mass=_sequence_mass(codes[start:end]),
+                    has_glycosylation_site=bool(glyco_sites),
                     glycosylation_sites=glyco_sites
                 )
 
@@ -321,9 +428,7 @@ class FastaParser:
             (has_motif: bool, sites: List[int])
             Sites are 0-indexed positions of N in the motif
         """
-        sites = []
-        for match in re.finditer(self.GLYCOSYLATION_MOTIF, sequence):
-            sites.append(match.start())  # Position of N
+        sites = [match.start() for match in self._motif_pattern().finditer(sequence)]  # Position of N
 
         return len(sites) > 0, sites
 
@@ -387,3 +492,52 @@ class FastaParser:
             "average_mass": sum(masses) / len(masses),
             "average_length": sum(lengths) / len(lengths),
         }
+
+
+def _file_stamp(path: Path) -> Tuple[int, int]:
+    """(mtime_ns, size) of a file, used to invalidate cached results"""
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+# Module-level so repeated parsers of one file share the work; kept small
+# because each entry holds a whole proteome or digest (FastaParser.clear_cache()
+# frees them). Cached objects are never handed out, only copies.
+@lru_cache(maxsize=8)
+def _parse_cached(path: str, stamp: Tuple[int, int]) -> Tuple[Protein, ...]:
+    """Parse a FASTA file once per (path, file state)"""
+    return tuple(FastaParser(path)._read_proteins())
+
+
+@lru_cache(maxsize=8)
+def _digest_cached(
+    parser_cls: type,
+    path: str,
+    stamp: Tuple[int, int],
+    enzyme: str,
+    missed_cleavages: int,
+    min_length: int,
+    max_length: int
+) -> Tuple[Peptide, ...]:
+    """
+    Digest a FASTA file once per (parser class, path, file state, parameters)
+
+    The peptides are never handed out directly; digest() copies them.
+    """
+    parser = parser_cls(path)
+    parser.proteins = list(_parse_cached(path, stamp))
+    return tuple(parser._digest_proteins(enzyme, missed_cleavages, min_length, max_length))
+
+
+def _copy_peptide(peptide: Peptide) -> Peptide:
+    """Independent copy of a cached Peptide (glycosylation_sites not shared)"""
+    return Peptide(
+        sequence=peptide.sequence,
+        protein_id=peptide.protein_id,
+        start_position=peptide.start_position,
+        end_position=peptide.end_position,
+        missed_cleavages=peptide.missed_cleavages,
+        mass=peptide.mass,
+        has_glycosylation_site=peptide.has_glycosylation_site,
+        glycosylation_sites=list(peptide.glycosylation_sites)
+    )
@@ -22,12 +22,17 @@ Date: 2025-10-21
 Phase: 2 (Week 2)
 """
 
+import operator
 import re
+import numpy as np
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Iterable, List, Dict, Optional
 from dataclasses import dataclass
 from enum import Enum
 
+from ._compat import DATACLASS_SLOTS
+
 
 class GlycanType(Enum):
     """Glycan classification types"""
@@ -46,8 +51,75 @@ MONOSACCHARIDE_MASSES = {
     'A': 291.095417,  # NeuAc (N-acetylneuraminic acid, sialic acid)
 }
 
+# Column order of monosaccharide count arrays
+MONOSACCHARIDE_ORDER = ('H', 'N', 'F', 'A')
+
+_RESIDUE_MASS = np.array([MONOSACCHARIDE_MASSES[m] for m in MONOSACCHARIDE_ORDER])
+
+# Pattern: Letter followed by number
+_COMPOSITION_PATTERN = re.compile(r'([HNFA])(\d+)')
+
+
+# GlycanType for each int8 type code produced by _classify_counts
+_GLYCAN_TYPES = tuple(GlycanType)
+_TYPE_CODE = {t: np.int8(i) for i, t in enumerate(_GLYCAN_TYPES)}
+
+# Classification rules in priority order, applied to H, N, F, A counts; the
+# first match wins and anything unmatched is Complex/Hybrid. Each rule works
+# on plain ints (one glycan) and on count columns (whole libraries)
+_TYPE_RULES = (
+    # High-mannose: H≥5, N=2, no F or A
+    (GlycanType.HIGH_MANNOSE, lambda h, n, f, a: (h >= 5) & (n == 2) & (f == 0) & (a == 0)),
+    (GlycanType.SIALOFUCOSYLATED, lambda h, n, f, a: (f > 0) & (a > 0)),
+    (GlycanType.FUCOSYLATED, lambda h, n, f, a: (f > 0) & (a == 0)),
+    (GlycanType.SIALYLATED, lambda h, n, f, a: (a > 0) & (f == 0)),
+)
+
+
+def _classify(h: int, n: int, f: int, a: int) -> GlycanType:
+    """Classify one glycan from its monosaccharide counts"""
+    for glycan_type, rule in _TYPE_RULES:
+        if rule(h, n, f, a):
+            return glycan_type
+    return GlycanType.COMPLEX_HYBRID
+
+
+def _classify_counts(counts: np.ndarray) -> np.ndarray:
+    """
+    Classify glycans from a monosaccharide count matrix
+
+    Parameters
+    ----------
+    counts : np.ndarray
+        Counts, shape (N, 4), columns in MONOSACCHARIDE_ORDER
+
+    Returns
+    -------
+    np.ndarray
+        int8 type code per row, indexing into _GLYCAN_TYPES
+    """
+    columns = counts.T
+    return np.select(
+        [rule(*columns) for _, rule in _TYPE_RULES],
+        [_TYPE_CODE[glycan_type] for glycan_type, _ in _TYPE_RULES],
+        default=_TYPE_CODE[GlycanType.COMPLEX_HYBRID]
+    ).astype(np.int8)
+
+
+def _same_items(a, b) -> bool:
+    """Whether two sequences hold the same objects in the same order"""
+    return len(a) == len(b) and all(map(operator.is_, a, b))
+
 
-@dataclass
+def _parse_counts(composition: str) -> Dict[str, int]:
+    """Parse a composition string into monosaccharide counts"""
+    counts = {'H': 0, 'N': 0, 'F': 0, 'A': 0}
+    for mono_type, count in _COMPOSITION_PATTERN.findall(composition):
+        counts[mono_type] = int(count)
+    return counts
+
+
+@dataclass(**DATACLASS_SLOTS)
 class Glycan:
     """
     Represents a glycan structure
@@ -85,17 +157,7 @@ class Glycan:
         Dict[str, int]
             Monosaccharide counts
         """
-        counts = {'H': 0, 'N': 0, 'F': 0, 'A': 0}
-
-        # Pattern: Letter followed by number
-        pattern = r'([HNFA])(\d+)'
-        for match in re.finditer(pattern, self.composition):
-            mono_type = match.group(1)
-            count = int(match.group(2))
-            if mono_type in counts:
-                counts[mono_type] = count
-
-        return counts
+        return _parse_counts(self.composition)
 
     def calculate_mass(self) -> float:
         """
@@ -121,29 +183,8 @@ class Glycan:
         GlycanType
             Glycan classification
         """
-        h = self.counts['H']
-        n = self.counts['N']
-        f = self.counts['F']
-        a = self.counts['A']
-
-        # High-mannose: H≥5, N=2, no F or A
-        if h >= 5 and n == 2 and f == 0 and a == 0:
-            return GlycanType.HIGH_MANNOSE
-
-        # Sialofucosylated: has both A and F
-        if f > 0 and a > 0:
-            return GlycanType.SIALOFUCOSYLATED
-
-        # Sialylated only: has A, no F
-        if a > 0 and f == 0:
-            return GlycanType.SIALYLATED
-
-        # Fucosylated only: has F, no A
-        if f > 0 and a == 0:
-            return GlycanType.FUCOSYLATED
-
-        # Complex/Hybrid: everything else
-        return GlycanType.COMPLEX_HYBRID
+        counts = self.counts
+        return _classify(counts['H'], counts['N'], counts['F'], counts['A'])
 
     def __repr__(self):
         return f"Glycan(comp='{self.composition}', mass={self.mass:.2f}, type={self.glycan_type.value})"
@@ -164,6 +205,9 @@ class GlycanDatabase:
     >>> glycans = db.generate_common_glycans()
     >>> glycan = db.get_glycan_by_composition("H5N4F1")
     >>> print(f"Mass: {glycan.mass:.2f} Da, Type: {glycan.glycan_type.value}")
+
+    The lookup and type index are rebuilt when the ``glycans`` list is
+    replaced or edited; the Glycan objects in it are treated as read-only.
     """
 
     def __init__(self, glycan_file_path: Optional[str] = None):
@@ -171,6 +215,15 @@ class GlycanDatabase:
         self.glycans: List[Glycan] = []
         self.composition_index: Dict[str, Glycan] = {}
 
+        # Structure-of-arrays view of self.glycans, rebuilt by _build_index
+        self._counts = np.zeros((0, len(MONOSACCHARIDE_ORDER)), dtype=np.int16)
+        self._types = np.zeros(0, dtype=np.int8)
+        self._indexed: tuple = ()  # Glycans the arrays describe
+
+        # (glycans, count matrix) from the last _create_glycans call, so
+        # _build_index can reuse the matrix instead of rebuilding it
+        self._created = ((), self._counts)
+
         if glycan_file_path:
             self.load_from_composition_file(glycan_file_path)
         else:
@@ -202,25 +255,98 @@ class GlycanDatabase:
         if not file_path.exists():
             raise FileNotFoundError(f"Glycan file not found: {file_path}")
 
-        self.glycans = []
-
         with open(file_path, 'r') as f:
-            for line in f:
-                composition = line.strip()
-                if composition and not composition.startswith('#'):
-                    try:
-                        glycan = Glycan(composition=composition)
-                        self.glycans.append(glycan)
-                    except Exception as e:
-                        print(f"Warning: Failed to parse '{composition}': {e}")
+            compositions = [
+                line.strip() for line in f
+                if line.strip() and not line.strip().startswith('#')
+            ]
 
+        self.glycans = self._create_glycans(compositions, "parse")
         self._build_index()
         return self.glycans
 
+    @staticmethod
+    def _count_matrix(compositions: Iterable[str]) -> np.ndarray:
+        """
+        Parse compositions into a monosaccharide count matrix
+
+        Parameters
+        ----------
+        compositions : Iterable[str]
+            Glycan compositions
+
+        Returns
+        -------
+        np.ndarray
+            Counts, shape (N, 4), columns in MONOSACCHARIDE_ORDER
+        """
+        rows = [_parse_counts(c) for c in compositions]
+        counts = np.zeros((len(rows), len(MONOSACCHARIDE_ORDER)), dtype=np.int16)
+        for i, row in enumerate(rows):
+            counts[i] = [row[m] for m in MONOSACCHARIDE_ORDER]
+        return counts
+
+    def _create_glycans(self, compositions: List[str], action: str) -> List[Glycan]:
+        """
+        Build Glycan objects with all masses from one matrix product and
+        all types from one classification pass
+
+        Parameters
+        ----------
+        compositions : List[str]
+            Glycan compositions
+        action : str
+            Verb used in the warning for a composition that fails
+
+        Returns
+        -------
+        List[Glycan]
+            Glycans with precomputed counts, masses and types
+        """
+        counts = self._count_matrix(compositions)
+        masses = counts @ _RESIDUE_MASS
+        types = _classify_counts(counts)
+
+        glycans = []
+        kept = []
+        for i, (composition, row, mass, code) in enumerate(zip(
+            compositions, counts.tolist(), masses.tolist(), types.tolist()
+        )):
+            try:
+                glycan = Glycan(
+                    composition=composition,
+                    mass=mass,
+                    glycan_type=_GLYCAN_TYPES[code],
+                    counts=dict(zip(MONOSACCHARIDE_ORDER, row))
+                )
+                glycans.append(glycan)
+                kept.append(i)
+            except Exception as e:
+                print(f"Warning: Failed to {action} glycan '{composition}': {e}")
+
+        self._created = (tuple(glycans), counts[kept])
+        return glycans
+
     def _build_index(self):
-        """Build composition lookup index"""
+        """Build composition lookup index and count/type arrays"""
         self.composition_index = {g.composition: g for g in self.glycans}
 
+        created_glycans, created_counts = self._created
+        if _same_items(self.glycans, created_glycans):
+            self._counts = created_counts
+        else:
+            self._counts = np.array(
+                [[g.counts[m] for m in MONOSACCHARIDE_ORDER] for g in self.glycans],
+                dtype=np.int16
+            ).reshape(-1, len(MONOSACCHARIDE_ORDER))
+        self._types = _classify_counts(self._counts)
+        self._indexed = tuple(self.glycans)
+
+    def _ensure_index(self):
+        """Rebuild the index if self.glycans changed since it was built"""
+        if not _same_items(self.glycans, self._indexed):
+            self._build_index()
+
     def get_glycan_by_composition(self, composition: str) -> Optional[Glycan]:
         """
         Get glycan by composition string
@@ -295,15 +421,7 @@ class GlycanDatabase:
             "H5N6F1A3", "H6N6F1A3",
         ]
 
-        glycans = []
-        for composition in common_compositions:
-            try:
-                glycan = Glycan(composition=composition)
-                glycans.append(glycan)
-            except Exception as e:
-                print(f"Warning: Failed to generate glycan '{composition}': {e}")
-
-        return glycans
+        return self._create_glycans(common_compositions, "generate")
 
     def filter_by_type(self, glycan_type: GlycanType) -> List[Glycan]:
         """
@@ -319,7 +437,9 @@ class GlycanDatabase:
         List[Glycan]
             Glycans of specified type
         """
-        return [g for g in self.glycans if g.glycan_type == glycan_type]
+        self._ensure_index()
+        code = _TYPE_CODE[glycan_type]
+        return [self.glycans[i] for i in np.flatnonzero(self._types == code).tolist()]
 
     def get_statistics(self) -> Dict:
         """
@@ -330,10 +450,9 @@ class GlycanDatabase:
         dict
             Statistics about glycan database
         """
-        type_counts = {}
-        for glycan_type in GlycanType:
-            count = sum(1 for g in self.glycans if g.glycan_type == glycan_type)
-            type_counts[glycan_type.value] = count
+        self._ensure_index()
+        code_counts = np.bincount(self._types, minlength=len(_GLYCAN_TYPES)).tolist()
+        type_counts = {t.value: c for t, c in zip(_GLYCAN_TYPES, code_counts)}
 
         masses = [g.mass for g in self.glycans]
 
@@ -343,3 +462,20 @@ class GlycanDatabase:
             "mass_range": (min(masses), max(masses)) if masses else (0, 0),
             "average_mass": sum(masses) / len(masses) if masses else 0,
         }
+
+
+@lru_cache(maxsize=1)
+def get_default_glycan_db() -> GlycanDatabase:
+    """
+    Shared GlycanDatabase built from the common N-glycan library
+
+    The library is generated on the first call and the same instance is
+    returned afterwards, so callers must treat it as read-only. Construct
+    GlycanDatabase directly when a private or file-backed library is needed.
+
+    Returns
+    -------
+    GlycanDatabase
+        Process-wide default glycan database
+    """
+    return GlycanDatabase()
@@ -0,0 +1,57 @@
+"""
+XCorr Kernels Module
+
+Explicit-loop kernels for the XCorr hot path, written so the same source
+can be used three ways (see xcorr_scorer.py for the selection logic):
+
+1. Compiled ahead of time with Pythran, which places an extension module
+   next to this file that Python imports in preference to the .py:
+
+       pythran -O3 -march=native src/scoring/_xcorr_kernels.py
+
+2. JIT-compiled with Numba (njit) when no Pythran build is present
+3. Skipped entirely in favour of the NumPy implementations in
+   xcorr_scorer.py when neither is available
+
+Keep the functions to plain loops over NumPy arrays so all three remain
+valid.
+"""
+
+
+# pythran export bin_peaks(float64[], float64[], float, float, float, float32[])
+# pythran export bin_peaks(float64[], float64[], float, float, float, float64[])
+def bin_peaks(mz, intensity, min_mz, max_mz, bin_size, out):
+    """Accumulate peak intensities into the binned buffer ``out``"""
+    num_bins = out.shape[0]
+    for i in range(mz.shape[0]):
+        if min_mz <= mz[i] <= max_mz:
+            bin_idx = int((mz[i] - min_mz) / bin_size)
+            if 0 <= bin_idx < num_bins:
+                out[bin_idx] += intensity[i]
+
+
+# pythran export background(float32[], int)
+# pythran export background(float64[], int)
+def background(correlation, lag_range):
+    """Mean of an unshifted correlation excluding lags within ±lag_range"""
+    n = correlation.shape[0]
+    start = lag_range + 1
+    stop = n - lag_range
+    if stop <= start:
+        return 0.0
+
+    total = 0.0
+    for i in range(start, stop):
+        total += correlation[i]
+    return total / (stop - start)
+
+
+# pythran export count_matched(float32[], int64[])
+# pythran export count_matched(float64[], int64[])
+def count_matched(observed, nz_idx):
+    """Count observed bins that are non-zero at the given indices"""
+    matched = 0
+    for i in range(nz_idx.shape[0]):
+        if observed[nz_idx[i]] != 0:
+            matched += 1
+    return matched
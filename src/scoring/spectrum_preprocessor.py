@@ -23,8 +23,9 @@ Phase: 3 (Week 3)
 """
 
 import numpy as np
+import scipy.fft as sfft
 from typing import Tuple, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
 @dataclass
@@ -35,7 +36,7 @@ class ProcessedSpectrum:
     Attributes
     ----------
     binned_intensities : np.ndarray
-        Binned and normalized intensities
+        Binned and normalized intensities (float32)
     bin_size : float
         Size of each bin (Da)
     min_mz : float
@@ -48,6 +49,10 @@ class ProcessedSpectrum:
         Number of peaks in original spectrum
     num_peaks_retained : int
         Number of peaks after filtering
+    binned_rfft : np.ndarray, optional
+        Cached rfft of binned_intensities, filled by ensure_rfft()
+    fft_len : int, optional
+        Zero-padded transform length used for binned_rfft
     """
     binned_intensities: np.ndarray
     bin_size: float
@@ -56,6 +61,36 @@ class ProcessedSpectrum:
     num_bins: int
     num_peaks_original: int
     num_peaks_retained: int
+    binned_rfft: Optional[np.ndarray] = field(default=None, repr=False)
+    fft_len: Optional[int] = field(default=None, repr=False)
+
+    def ensure_rfft(self, workers: int = -1) -> np.ndarray:
+        """
+        Compute (once) and return the rfft of the binned intensities
+
+        The observed spectrum is fixed across a candidate sweep, so its
+        transform is cached here and reused for every candidate. The cache
+        is not invalidated if binned_intensities is modified in place.
+
+        The spectrum is zero-padded to the next 5-smooth length (fft_len),
+        which keeps pocketfft on its fast mixed-radix path for any bin count.
+
+        Parameters
+        ----------
+        workers : int
+            Worker threads passed to scipy.fft (default: -1, all cores)
+
+        Returns
+        -------
+        np.ndarray
+            rfft of binned_intensities
+        """
+        if self.binned_rfft is None:
+            self.fft_len = sfft.next_fast_len(len(self.binned_intensities), real=True)
+            self.binned_rfft = sfft.rfft(
+                self.binned_intensities, n=self.fft_len, workers=workers
+            )
+        return self.binned_rfft
 
     def __repr__(self):
         return (
@@ -308,10 +343,10 @@ class SpectrumPreprocessor:
         Returns
         -------
         np.ndarray
-            Binned intensities (length = num_bins)
+            Binned intensities (length = num_bins, float32)
         """
-        # Initialize binned array
-        binned = np.zeros(self.num_bins)
+        # Initialize binned array (single precision is ample for XCorr)
+        binned = np.zeros(self.num_bins, dtype=np.float32)
 
         # Assign peaks to bins
         for mz, intensity in zip(mz_array, intensity_array):
@@ -356,7 +391,7 @@ class SpectrumPreprocessor:
             region = binned[start:end]
 
             # Skip empty regions
-            if len(region) == 0 or np.sum(region) == 0:
+            if np.count_nonzero(region) == 0:
                 continue
 
             # Z-score normalization
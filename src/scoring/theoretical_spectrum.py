@@ -24,7 +24,7 @@ Phase: 3 (Week 3)
 """
 
 import numpy as np
-from typing import List
+from typing import List, Tuple
 from dataclasses import dataclass
 
 from ..database import GlycopeptideCandidate
@@ -93,6 +93,26 @@ class TheoreticalPeak:
             return f"{self.ion_type}{loss} (m/z {self.mz:.2f})"
 
 
+def peaks_to_arrays(peaks: List[TheoreticalPeak]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Extract m/z and intensity of theoretical peaks as contiguous arrays
+
+    Parameters
+    ----------
+    peaks : List[TheoreticalPeak]
+        Theoretical peaks
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        float64 m/z and intensity arrays
+    """
+    count = len(peaks)
+    mz = np.fromiter((peak.mz for peak in peaks), dtype=np.float64, count=count)
+    intensity = np.fromiter((peak.intensity for peak in peaks), dtype=np.float64, count=count)
+    return mz, intensity
+
+
 class TheoreticalSpectrumGenerator:
     """
     Generate theoretical fragment ion spectrum for glycopeptides
@@ -482,16 +502,22 @@ class TheoreticalSpectrumGenerator:
         Returns
         -------
         np.ndarray
-            Binned intensities
+            Binned intensities (float32)
         """
         num_bins = int((max_mz - min_mz) / bin_size) + 1
-        binned = np.zeros(num_bins)
 
-        for peak in peaks:
-            if min_mz <= peak.mz <= max_mz:
-                bin_idx = int((peak.mz - min_mz) / bin_size)
-                if 0 <= bin_idx < num_bins:
-                    # Sum intensities in same bin
-                    binned[bin_idx] += peak.intensity
+        mz, intensity = peaks_to_arrays(peaks)
+
+        # Bin indices for peaks inside the m/z window
+        in_range = (mz >= min_mz) & (mz <= max_mz)
+        idx = np.floor((mz[in_range] - min_mz) / bin_size).astype(np.intp)
+        mask = (idx >= 0) & (idx < num_bins)
+
+        # Sum intensities in same bin (bincount is a dedicated scatter-add loop)
+        binned = np.bincount(
+            idx[mask],
+            weights=intensity[in_range][mask].astype(np.float32),
+            minlength=num_bins
+        )
 
-        return binned
+        return binned.astype(np.float32)
@@ -21,12 +21,79 @@ Date: 2025-10-21
 Phase: 3 (Week 3)
 """
 
+import os
+import threading
 import numpy as np
-from typing import List
+import scipy.fft as sfft
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
 from dataclasses import dataclass
 
+from . import _xcorr_kernels
 from .spectrum_preprocessor import ProcessedSpectrum
-from .theoretical_spectrum import TheoreticalPeak
+from .theoretical_spectrum import TheoreticalPeak, peaks_to_arrays
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# A Pythran build of _xcorr_kernels is an extension module, not a .py file
+PYTHRAN_AVAILABLE = not _xcorr_kernels.__file__.endswith('.py')
+
+# Candidates per task when rank_candidates fans out over threads
+BATCH_CHUNK_SIZE = 64
+
+
+def _bin_peaks_numpy(
+    mz: np.ndarray,
+    intensity: np.ndarray,
+    min_mz: float,
+    max_mz: float,
+    bin_size: float,
+    out: np.ndarray
+):
+    """Accumulate peak intensities into the binned buffer ``out`` (NumPy path)"""
+    num_bins = out.shape[0]
+
+    mask = (mz >= min_mz) & (mz <= max_mz)
+    bin_idx = ((mz[mask] - min_mz) / bin_size).astype(np.int64)
+    in_bounds = (bin_idx >= 0) & (bin_idx < num_bins)
+
+    out += np.bincount(
+        bin_idx[in_bounds],
+        weights=intensity[mask][in_bounds],
+        minlength=num_bins
+    )
+
+
+def _background_numpy(correlation: np.ndarray, lag_range: int) -> float:
+    """Mean of an unshifted correlation excluding lags within ±lag_range (NumPy path)"""
+    n = correlation.shape[0]
+    if n - lag_range <= lag_range + 1:
+        return 0.0
+    return float(correlation[lag_range + 1:n - lag_range].mean(dtype=np.float64))
+
+
+def _count_matched_numpy(observed: np.ndarray, nz_idx: np.ndarray) -> int:
+    """Count observed bins that are non-zero at the given indices (NumPy path)"""
+    return int(np.count_nonzero(observed[nz_idx]))
+
+
+# Kernel selection: Pythran AOT build > Numba JIT > NumPy
+if PYTHRAN_AVAILABLE:
+    _bin_peaks = _xcorr_kernels.bin_peaks
+    _background = _xcorr_kernels.background
+    _count_matched = _xcorr_kernels.count_matched
+elif NUMBA_AVAILABLE:
+    _bin_peaks = njit(cache=True)(_xcorr_kernels.bin_peaks)
+    _background = njit(cache=True)(_xcorr_kernels.background)
+    _count_matched = njit(cache=True)(_xcorr_kernels.count_matched)
+else:
+    _bin_peaks = _bin_peaks_numpy
+    _background = _background_numpy
+    _count_matched = _count_matched_numpy
 
 
 @dataclass
@@ -65,6 +132,13 @@ class XCorrScorer:
         SEQUEST uses ±75 bins around lag 0
     bin_size : float
         Bin size for spectra (default: 1.0005 Da)
+    workers : int
+        Worker threads for rank_candidates and scipy.fft (default: -1, all cores)
+    min_peaks_for_xcorr : int
+        Minimum matched peaks before the FFT background is computed
+        (default: 3). Candidates below it get xcorr = 0.0 and are therefore
+        dropped by rank_candidates unless return_all=True. Set to 0 to score
+        every candidate in full.
 
     Examples
     --------
@@ -76,11 +150,25 @@ class XCorrScorer:
     def __init__(
         self,
         lag_range: int = 75,
-        bin_size: float = 1.0005
+        bin_size: float = 1.0005,
+        workers: int = -1,
+        min_peaks_for_xcorr: int = 3
     ):
         """Initialize XCorr scorer"""
         self.lag_range = lag_range
         self.bin_size = bin_size
+        self.workers = workers
+        self.min_peaks_for_xcorr = min_peaks_for_xcorr
+
+        # Per-thread scratch buffer for score(), reused across candidates
+        self._local = threading.local()
+
+        if NUMBA_AVAILABLE and not PYTHRAN_AVAILABLE:
+            # Trigger JIT compilation (or on-disk cache load) up front
+            scratch = np.zeros(1, dtype=np.float32)
+            _bin_peaks(np.zeros(1), np.zeros(1), 0.0, 1.0, 1.0, scratch)
+            _background(scratch, self.lag_range)
+            _count_matched(scratch, np.zeros(1, dtype=np.int64))
 
     def score(
         self,
@@ -110,37 +198,50 @@ class XCorrScorer:
                 matched_peaks=0
             )
 
-        # Convert theoretical peaks to binned spectrum
-        theoretical_binned = self._create_theoretical_binned(
+        # Convert theoretical peaks to binned spectrum (reused buffer)
+        theoretical_binned = self._create_theoretical_binned_into(
             theoretical,
             observed.bin_size,
             observed.min_mz,
             observed.max_mz,
-            observed.num_bins
+            self._theoretical_buffer(observed.num_bins)
         )
 
-        # Calculate cross-correlation using FFT
-        correlation = self._cross_correlate_fft(
+        # Correlation at lag 0 is the dot product observed . theoretical;
+        # the theoretical spectrum is sparse, so gather its nonzero bins only
+        nz_idx = np.flatnonzero(theoretical_binned)
+        nz_val = theoretical_binned[nz_idx]
+        raw_correlation = float(np.dot(observed.binned_intensities[nz_idx], nz_val))
+
+        # Count matched peaks (non-zero overlap)
+        matched_peaks = self._count_matched_peaks(
             observed.binned_intensities,
-            theoretical_binned
+            nz_idx
         )
 
-        # Get correlation at lag 0 (center of correlation array)
-        lag_0_idx = len(correlation) // 2
-        raw_correlation = correlation[lag_0_idx]
+        # Too few matches to be a credible hit: skip the FFT entirely
+        if matched_peaks < self.min_peaks_for_xcorr:
+            return XCorrScore(
+                xcorr=0.0,
+                raw_correlation=raw_correlation,
+                background=0.0,
+                matched_peaks=matched_peaks
+            )
+
+        # Calculate cross-correlation using FFT (needed for the background)
+        correlation = self._cross_correlate_fft(
+            observed.binned_intensities,
+            theoretical_binned,
+            observed_fft=observed.ensure_rfft(self.workers),
+            fft_len=observed.fft_len
+        )
 
         # Calculate background (average correlation excluding lag range)
-        background = self._calculate_background(correlation, lag_0_idx)
+        background = float(self._calculate_background(correlation))
 
         # Final XCorr = correlation at lag 0 - background
         xcorr = raw_correlation - background
 
-        # Count matched peaks (non-zero overlap)
-        matched_peaks = self._count_matched_peaks(
-            observed.binned_intensities,
-            theoretical_binned
-        )
-
         return XCorrScore(
             xcorr=xcorr,
             raw_correlation=raw_correlation,
@@ -175,23 +276,65 @@ class XCorrScorer:
         Returns
         -------
         np.ndarray
-            Binned theoretical spectrum
+            Binned theoretical spectrum (float32)
+        """
+        binned = np.zeros(num_bins, dtype=np.float32)
+
+        return self._create_theoretical_binned_into(
+            theoretical, bin_size, min_mz, max_mz, binned
+        )
+
+    def _create_theoretical_binned_into(
+        self,
+        theoretical: List[TheoreticalPeak],
+        bin_size: float,
+        min_mz: float,
+        max_mz: float,
+        out: np.ndarray
+    ) -> np.ndarray:
+        """
+        Convert theoretical peaks to binned array in a caller-owned buffer
+
+        Parameters
+        ----------
+        theoretical : List[TheoreticalPeak]
+            Theoretical peaks
+        bin_size : float
+            Bin size (Da)
+        min_mz : float
+            Minimum m/z
+        max_mz : float
+            Maximum m/z
+        out : np.ndarray
+            Buffer of length num_bins; zeroed and overwritten
+
+        Returns
+        -------
+        np.ndarray
+            ``out``, holding the binned theoretical spectrum
         """
-        binned = np.zeros(num_bins)
+        out.fill(0)
 
-        for peak in theoretical:
-            if min_mz <= peak.mz <= max_mz:
-                bin_idx = int((peak.mz - min_mz) / bin_size)
-                if 0 <= bin_idx < num_bins:
-                    # Use theoretical intensity
-                    binned[bin_idx] += peak.intensity
+        # Sum theoretical intensities falling into the same bin
+        peak_mz, peak_intensity = peaks_to_arrays(theoretical)
+        _bin_peaks(peak_mz, peak_intensity, min_mz, max_mz, bin_size, out)
 
-        return binned
+        return out
+
+    def _theoretical_buffer(self, num_bins: int) -> np.ndarray:
+        """Return this thread's float32 scratch buffer of length num_bins"""
+        buffer = getattr(self._local, 'theoretical_binned', None)
+        if buffer is None or buffer.shape[0] != num_bins:
+            buffer = np.empty(num_bins, dtype=np.float32)
+            self._local.theoretical_binned = buffer
+        return buffer
 
     def _cross_correlate_fft(
         self,
         observed: np.ndarray,
-        theoretical: np.ndarray
+        theoretical: np.ndarray,
+        observed_fft: Optional[np.ndarray] = None,
+        fft_len: Optional[int] = None
     ) -> np.ndarray:
         """
         Calculate cross-correlation using FFT (fast)
@@ -199,77 +342,123 @@ class XCorrScorer:
         Cross-correlation in spatial domain = multiplication in frequency domain
         xcorr(x, y) = IFFT(FFT(x) * conj(FFT(y)))
 
+        Both spectra are real, so the half-spectrum transforms (rfft/irfft)
+        are used; this halves the frequency-domain buffers and multiplies.
+
         Parameters
         ----------
         observed : np.ndarray
             Observed spectrum (binned, normalized)
         theoretical : np.ndarray
             Theoretical spectrum (binned)
+        observed_fft : np.ndarray, optional
+            Precomputed rfft of ``observed``; computed here if not given
+        fft_len : int, optional
+            Transform length ``observed_fft`` was computed with
+            (default: next 5-smooth length >= len(observed))
 
         Returns
         -------
         np.ndarray
-            Cross-correlation at all lags
+            Cross-correlation at all fft_len lags
         """
         # Ensure same length
         assert len(observed) == len(theoretical), "Spectra must have same length"
 
-        # FFT of both spectra
-        obs_fft = np.fft.fft(observed)
-        theo_fft = np.fft.fft(theoretical)
+        # Zero-pad to a 5-smooth length so the transform stays fast
+        n = fft_len or sfft.next_fast_len(len(observed), real=True)
 
-        # Cross-correlation in frequency domain
-        # Multiply FFT(observed) by conjugate of FFT(theoretical)
-        cross_fft = obs_fft * np.conj(theo_fft)
+        # Real FFT of the observed spectrum unless cached. Not delegated to
+        # scipy.signal.correlate: score() and rank_candidates always pass the
+        # cached observed rfft, which correlate cannot reuse
+        if observed_fft is None:
+            observed_fft = sfft.rfft(observed, n=n, workers=self.workers)
 
-        # IFFT to get correlation in spatial domain
-        correlation = np.fft.ifft(cross_fft).real
+        # Dense rfft even though theoretical is sparse: a direct DFT over its
+        # non-zero bins only broke even at <= 2 peaks (2000-13824 bins), and
+        # candidates reaching this point have >= min_peaks_for_xcorr peaks
+        theo_rfft = sfft.rfft(theoretical, n=n, workers=self.workers)
 
-        # Shift to center (lag 0 at center)
-        correlation = np.fft.fftshift(correlation)
+        # Cross-correlation in frequency domain
+        # Multiply FFT(observed) by conjugate of FFT(theoretical)
+        cross_fft = observed_fft * np.conj(theo_rfft)
 
-        return correlation
+        # Inverse real FFT to get correlation in spatial domain
+        # (lag 0 at index 0, negative lags wrapped to the end)
+        return sfft.irfft(cross_fft, n=n, workers=self.workers)
 
-    def _calculate_background(
-        self,
-        correlation: np.ndarray,
-        lag_0_idx: int
-    ) -> float:
+    def _calculate_background(self, correlation: np.ndarray) -> np.ndarray:
         """
         Calculate background correlation (average excluding lag range)
 
+        ``correlation`` is raw IFFT output: lag 0 at index 0, positive lags
+        following it and negative lags wrapped to the end. Lags within
+        ±lag_range therefore occupy both ends, and the background is the
+        contiguous slice between them.
+
         Parameters
         ----------
         correlation : np.ndarray
-            Cross-correlation at all lags
-        lag_0_idx : int
-            Index of lag 0
+            Cross-correlation at all lags, shape (fft_len,) or
+            (num_candidates, fft_len)
 
         Returns
         -------
-        float
-            Background correlation
+        np.ndarray
+            Background correlation (scalar for 1-D input, else per candidate)
+        """
+        if correlation.ndim == 1:
+            return _background(correlation, self.lag_range)
+
+        n = correlation.shape[-1]
+        background = correlation[..., self.lag_range + 1:n - self.lag_range]
+
+        if background.shape[-1] == 0:
+            return np.zeros(correlation.shape[:-1])
+
+        return background.mean(axis=-1, dtype=np.float64)
+
+    def _batch_background(
+        self,
+        observed_fft: np.ndarray,
+        theo_mat: np.ndarray,
+        fft_len: int,
+        workers: int
+    ) -> np.ndarray:
         """
-        # Exclude ±lag_range bins around lag 0
-        start_exclude = max(0, lag_0_idx - self.lag_range)
-        end_exclude = min(len(correlation), lag_0_idx + self.lag_range + 1)
+        Calculate background for a block of theoretical spectra
 
-        # Create mask for background region
-        mask = np.ones(len(correlation), dtype=bool)
-        mask[start_exclude:end_exclude] = False
+        Parameters
+        ----------
+        observed_fft : np.ndarray
+            rfft of the observed spectrum
+        theo_mat : np.ndarray
+            Binned theoretical spectra, shape (num_candidates, num_bins)
+        fft_len : int
+            Zero-padded transform length of ``observed_fft``
+        workers : int
+            Worker threads passed to scipy.fft
 
-        # Calculate mean of background region
-        if np.sum(mask) > 0:
-            background = np.mean(correlation[mask])
-        else:
-            background = 0.0
+        Returns
+        -------
+        np.ndarray
+            Background correlation per candidate
+        """
+        # One batched transform for the whole block
+        theo_rfft = sfft.rfft(theo_mat, n=fft_len, axis=1, workers=workers)
+        correlation = sfft.irfft(
+            observed_fft * np.conj(theo_rfft),
+            n=fft_len,
+            axis=1,
+            workers=workers
+        )
 
-        return background
+        return self._calculate_background(correlation)
 
     def _count_matched_peaks(
         self,
         observed: np.ndarray,
-        theoretical: np.ndarray
+        nz_idx: np.ndarray
     ) -> int:
         """
         Count number of matched peaks (both non-zero)
@@ -278,17 +467,16 @@ class XCorrScorer:
         ----------
         observed : np.ndarray
             Observed spectrum
-        theoretical : np.ndarray
-            Theoretical spectrum
+        nz_idx : np.ndarray
+            Indices of the non-zero theoretical bins
 
         Returns
         -------
         int
             Number of matched peaks
         """
-        # Both arrays must be non-zero
-        matched = (observed != 0) & (theoretical != 0)
-        return int(np.sum(matched))
+        # Only bins where the theoretical spectrum is non-zero can match
+        return int(_count_matched(observed, nz_idx))
 
     def rank_candidates(
         self,
@@ -314,7 +502,9 @@ class XCorrScorer:
         List[tuple]
             Candidates with XCorr scores, sorted by XCorr (descending)
         """
-        scored_candidates = []
+        candidates = []
+        theoreticals = []
+        sp_scores = []
 
         for item in candidates_with_spectra:
             # Handle both (candidate, theoretical) and (candidate, theoretical, sp_score)
@@ -324,24 +514,91 @@ class XCorrScorer:
             else:
                 candidate, theoretical, sp_score = item[:3]
 
-            xcorr_score = self.score(observed, theoretical)
+            candidates.append(candidate)
+            theoreticals.append(theoretical)
+            sp_scores.append(sp_score)
+
+        observed_binned = observed.binned_intensities
+        num_bins = len(observed_binned)
+        observed_fft = observed.ensure_rfft(self.workers)
+
+        # Stack all theoretical spectra into one (K, N) matrix,
+        # binning each candidate directly into its row (no per-candidate buffer)
+        theo_mat = np.zeros((len(candidates), num_bins), dtype=np.float32)
+        for k, theoretical in enumerate(theoreticals):
+            if len(theoretical) > 0:
+                peak_mz, peak_intensity = peaks_to_arrays(theoretical)
+                _bin_peaks(
+                    peak_mz,
+                    peak_intensity,
+                    observed.min_mz,
+                    observed.max_mz,
+                    observed.bin_size,
+                    theo_mat[k]
+                )
+
+        # Lag-0 correlation and matched peaks from the sparse (row, bin)
+        # pattern of theo_mat
+        rows, cols = np.nonzero(theo_mat)
+        observed_at = observed_binned[cols]
+        raw_correlation = np.bincount(
+            rows,
+            weights=observed_at * theo_mat[rows, cols],
+            minlength=len(candidates)
+        )
+        matched_peaks = np.bincount(
+            rows[observed_at != 0],
+            minlength=len(candidates)
+        )
 
-            if sp_score is not None:
-                scored_candidates.append((candidate, xcorr_score, sp_score))
-            else:
-                scored_candidates.append((candidate, xcorr_score))
+        # Only candidates with enough matched peaks need the FFT background
+        active = np.flatnonzero(matched_peaks >= self.min_peaks_for_xcorr)
+        background = np.zeros(len(candidates))
+        xcorr = np.zeros(len(candidates))
+
+        num_threads = (os.cpu_count() or 1) if self.workers < 0 else self.workers
+        chunks = [
+            active[i:i + BATCH_CHUNK_SIZE]
+            for i in range(0, len(active), BATCH_CHUNK_SIZE)
+        ]
+
+        if len(chunks) > 1 and num_threads > 1:
+            # Candidates are independent and pocketfft releases the GIL,
+            # so chunks run concurrently with one FFT thread each
+            with ThreadPoolExecutor(max_workers=num_threads) as executor:
+                chunk_backgrounds = executor.map(
+                    lambda chunk: self._batch_background(
+                        observed_fft, theo_mat[chunk], observed.fft_len, workers=1
+                    ),
+                    chunks
+                )
+                for chunk, chunk_background in zip(chunks, chunk_backgrounds):
+                    background[chunk] = chunk_background
+        elif len(active) > 0:
+            background[active] = self._batch_background(
+                observed_fft, theo_mat[active], observed.fft_len, workers=self.workers
+            )
 
-        # Sort by XCorr (descending)
-        scored_candidates.sort(
-            key=lambda x: x[1].xcorr if isinstance(x[1], XCorrScore) else x[1],
-            reverse=True
-        )
+        xcorr[active] = raw_correlation[active] - background[active]
 
-        # Filter to positive XCorr unless return_all
+        # Sort by XCorr (descending, ties keep input order) and filter to
+        # positive XCorr unless return_all, before building result objects
+        order = np.argsort(-xcorr, kind='stable')
         if not return_all:
-            scored_candidates = [
-                item for item in scored_candidates
-                if (item[1].xcorr if isinstance(item[1], XCorrScore) else item[1]) > 0
-            ]
+            order = order[xcorr[order] > 0]
+
+        scored_candidates = []
+        for k in order:
+            xcorr_score = XCorrScore(
+                xcorr=float(xcorr[k]),
+                raw_correlation=float(raw_correlation[k]),
+                background=float(background[k]),
+                matched_peaks=int(matched_peaks[k])
+            )
+
+            if sp_scores[k] is not None:
+                scored_candidates.append((candidates[k], xcorr_score, sp_scores[k]))
+            else:
+                scored_candidates.append((candidates[k], xcorr_score))
 
         return scored_candidates
@@ -5,7 +5,7 @@ Tests SMILES conversion for peptides, glycans, and glycopeptides.
 
 Usage:
     pytest tests/test_chemoinformatics.py -v
-    python tests/test_chemoinformatics.py  # Standalone mode
+    python -m tests.test_chemoinformatics  # Standalone mode, from the repository root
 
 Author: Glycoproteomics Pipeline Team
 Date: 2025-10-21
@@ -16,10 +16,6 @@ import sys
 import os
 import tempfile
 import unittest
-from pathlib import Path
-
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.chemoinformatics import (
     PeptideSMILESConverter, PeptideSMILES,
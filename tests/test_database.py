@@ -38,7 +38,7 @@ Edge Cases Tested:
 Usage:
 ------
     pytest tests/test_database.py -v
-    python tests/test_database.py  # Standalone mode
+    python -m tests.test_database  # Standalone mode, from the repository root
 
 Expected Results:
 -----------------
@@ -56,15 +56,11 @@ import sys
 import os
 import tempfile
 import unittest
-from pathlib import Path
-
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.database import (
     FastaParser, Peptide, Protein,
-    GlycanDatabase, Glycan, GlycanType,
-    CandidateGenerator, GlycopeptideCandidate
+    GlycanDatabase, Glycan, GlycanType, get_default_glycan_db,
+    CandidateGenerator, CandidateView, GlycopeptideCandidate
 )
 
 
@@ -118,9 +114,10 @@ class TestGlycan(unittest.TestCase):
 class TestGlycanDatabase(unittest.TestCase):
     """Test GlycanDatabase class"""
 
-    def setUp(self):
-        """Set up test fixtures"""
-        self.db = GlycanDatabase()
+    @classmethod
+    def setUpClass(cls):
+        """Build the glycan library once; tests only read it"""
+        cls.db = get_default_glycan_db()
 
     def test_generate_common_glycans(self):
         """Test common glycan generation"""
@@ -153,13 +150,23 @@ class TestGlycanDatabase(unittest.TestCase):
         self.assertIn("type_distribution", stats)
         self.assertGreater(stats["total_glycans"], 0)
 
+    def test_index_follows_glycan_list(self):
+        """Test filter_by_type/get_statistics see edits to the glycans list"""
+        db = GlycanDatabase()
+        hm_before = len(db.filter_by_type(GlycanType.HIGH_MANNOSE))
+
+        db.glycans.append(Glycan(composition="H10N2"))
+        self.assertEqual(len(db.filter_by_type(GlycanType.HIGH_MANNOSE)), hm_before + 1)
+
+        db.glycans = [g for g in db.glycans if g.glycan_type != GlycanType.HIGH_MANNOSE]
+        self.assertEqual(db.filter_by_type(GlycanType.HIGH_MANNOSE), [])
+        self.assertEqual(db.get_statistics()["type_distribution"]["HM"], 0)
+
     def test_load_from_file(self):
         """Test loading from custom file"""
         # Create temporary glycan file
         with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.txt') as f:
-            f.write("H5N2\n")
-            f.write("H6N2\n")
-            f.write("H5N4F1\n")
+            f.write("H5N2\nH6N2\nH5N4F1\n")
             temp_file = f.name
 
         try:
@@ -192,6 +199,25 @@ class TestPeptide(unittest.TestCase):
         self.assertTrue(has_glyco)
         self.assertEqual(sites, [0])  # N at position 0
 
+    def test_overlapping_glycosylation_sites(self):
+        """Test overlapping sequons report every N"""
+        parser = FastaParser.__new__(FastaParser)
+        has_glyco, sites = parser._has_glycosylation_motif("ANNSTK")
+        self.assertTrue(has_glyco)
+        self.assertEqual(sites, [1, 2])  # N-N-S and N-S-T
+
+        has_glyco, sites = parser._has_glycosylation_motif("NPSK")
+        self.assertFalse(has_glyco)  # X = P is not a sequon
+
+    def test_glycosylation_motif_override(self):
+        """Test a subclass's GLYCOSYLATION_MOTIF is used for site detection"""
+        class NXCParser(FastaParser):
+            GLYCOSYLATION_MOTIF = r'N[^P][STC]'
+
+        parser = NXCParser.__new__(NXCParser)
+        self.assertEqual(parser._has_glycosylation_motif("ANGCK"), (True, [1]))
+        self.assertEqual(FastaParser.__new__(FastaParser)._has_glycosylation_motif("ANGCK"), (False, []))
+
 
 class TestFastaParser(unittest.TestCase):
     """Test FastaParser class"""
@@ -204,10 +230,12 @@ class TestFastaParser(unittest.TestCase):
             delete=False,
             suffix='.fasta'
         )
-        self.temp_fasta.write(">TEST_PROTEIN Test protein description\n")
-        self.temp_fasta.write("NGTIINEKAGFAGDDAPRAVFPSIVGRPRHQGVMVGMGQK\n")
-        self.temp_fasta.write(">TEST_PROTEIN2 Another test protein\n")
-        self.temp_fasta.write("MKLNISFPATGCQKLIEVDDERRGYNAQEYYDRIPELR\n")
+        self.temp_fasta.write(
+            ">TEST_PROTEIN Test protein description\n"
+            "NGTIINEKAGFAGDDAPRAVFPSIVGRPRHQGVMVGMGQK\n"
+            ">TEST_PROTEIN2 Another test protein\n"
+            "MKLNISFPATGCQKLIEVDDERRGYNAQEYYDRIPELR\n"
+        )
         self.temp_fasta.close()
 
     def tearDown(self):
@@ -287,10 +315,89 @@ class TestFastaParser(unittest.TestCase):
         self.assertIn("with_glycosylation_sites", stats)
         self.assertGreater(stats["total_peptides"], 0)
 
+    def test_digest_cache_invalidation(self):
+        """Test cached digests are refreshed when the FASTA file changes"""
+        peptides = FastaParser(self.temp_fasta.name).digest(missed_cleavages=0)
+        self.assertIn("AGFAGDDAPR", [p.sequence for p in peptides])
+
+        with open(self.temp_fasta.name, 'w') as f:
+            f.write(">TEST_PROTEIN3 Replacement protein\nLNVTEGKSAMPLER\n")
+        stat = os.stat(self.temp_fasta.name)
+        os.utime(self.temp_fasta.name, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        peptides = FastaParser(self.temp_fasta.name).digest(missed_cleavages=0)
+        self.assertEqual([p.sequence for p in peptides], ["LNVTEGK", "SAMPLER"])
+
+    def test_digest_mass_matches_peptide(self):
+        """Test digested masses equal Peptide.calculate_mass exactly"""
+        parser = FastaParser(self.temp_fasta.name)
+        for peptide in parser.digest(missed_cleavages=2):
+            self.assertEqual(peptide.mass, peptide.calculate_mass())
+
+    def test_digest_follows_proteins(self):
+        """Test digest() uses an edited protein list and returns unshared peptides"""
+        parser = FastaParser(self.temp_fasta.name)
+        proteins = parser.parse()
+        self.assertEqual(len({p.protein_id for p in parser.digest()}), 2)
+
+        parser.proteins = proteins[:1]
+        self.assertEqual({p.protein_id for p in parser.digest()}, {proteins[0].id})
+
+        # Peptides from the cache are copies: edits do not reach other parsers
+        first = FastaParser(self.temp_fasta.name).digest()
+        first[0].glycosylation_sites.append(99)
+        second = FastaParser(self.temp_fasta.name).digest()
+        self.assertNotIn(99, second[0].glycosylation_sites)
+
+    def test_digest_subclass_enzymes(self):
+        """Test a subclass's ENZYMES are used for cached digests"""
+        class LysNParser(FastaParser):
+            ENZYMES = {**FastaParser.ENZYMES, 'trypsin': r'(?=K)'}
+
+        default = FastaParser(self.temp_fasta.name).digest(missed_cleavages=0)
+        custom = LysNParser(self.temp_fasta.name).digest(missed_cleavages=0)
+        self.assertNotEqual([p.sequence for p in default], [p.sequence for p in custom])
+        self.assertTrue(all(p.sequence.startswith('K') for p in custom if p.start_position > 1))
+
+    def test_parse_returns_copies(self):
+        """Test edits to parsed proteins reach neither the cache nor other parsers"""
+        parser = FastaParser(self.temp_fasta.name)
+        proteins = parser.parse()
+        original = proteins[0].sequence
+        proteins[0].sequence = "NKSNKS"
+
+        self.assertEqual(FastaParser(self.temp_fasta.name).parse()[0].sequence, original)
+        # The edited protein is digested, not the cached one
+        self.assertIn("NKSNKS", [p.sequence for p in parser.digest(min_length=1)])
+
+        FastaParser.clear_cache()
+        self.assertEqual(FastaParser(self.temp_fasta.name).parse()[0].sequence, original)
+
+    def test_digest_subclass_init(self):
+        """Test cached digests build their parser through the subclass __init__"""
+        class MotifParser(FastaParser):
+            def __init__(self, fasta_file_path, residue="N"):
+                super().__init__(fasta_file_path)
+                self.residue = residue
+
+            def _digest_proteins(self, *args):
+                peptides = super()._digest_proteins(*args)
+                return [p for p in peptides if self.residue in p.sequence]
+
+        FastaParser.clear_cache()
+        peptides = MotifParser(self.temp_fasta.name).digest()
+        self.assertGreater(len(peptides), 0)
+        self.assertTrue(all("N" in p.sequence for p in peptides))
+
 
 class TestCandidateGenerator(unittest.TestCase):
     """Test CandidateGenerator class"""
 
+    @classmethod
+    def setUpClass(cls):
+        """Build the glycan library once; tests only read it"""
+        cls.glycan_db = get_default_glycan_db()
+
     def setUp(self):
         """Set up test fixtures"""
         # Create mock peptides
@@ -313,8 +420,6 @@ class TestCandidateGenerator(unittest.TestCase):
             ),
         ]
 
-        # Create glycan database
-        self.glycan_db = GlycanDatabase()
         self.glycans = self.glycan_db.glycans[:10]  # Use first 10 glycans
 
         # Create candidate generator
@@ -367,6 +472,50 @@ class TestCandidateGenerator(unittest.TestCase):
         # More candidates with looser tolerance
         self.assertGreaterEqual(len(candidates_100ppm), len(candidates_10ppm))
 
+    def test_candidate_view(self):
+        """Test candidates are built lazily from the record array"""
+        candidates = self.generator.generate_candidates(
+            precursor_mz=1052.95,  # NGTIINEK + H5N2, as in test_generate_candidates_basic
+            charge=2,
+            tolerance_ppm=50.0
+        )
+        self.assertIsInstance(candidates, CandidateView)
+        self.assertEqual(len(candidates.records), len(candidates))
+        self.assertGreater(len(candidates), 0)
+
+        first = candidates[0]
+        self.assertIsInstance(first, GlycopeptideCandidate)
+        self.assertIs(candidates[0], first)  # materialized once
+        self.assertIs(candidates[-len(candidates)], first)
+        self.assertEqual(first.ppm_error, candidates.records['ppm'][0])
+        self.assertEqual(candidates[:1], [first])
+
+        # list() gives a mutable list of the same candidates
+        as_list = list(candidates)
+        as_list.sort(key=lambda c: c.theoretical_mass)
+        self.assertEqual(len(as_list), len(candidates))
+        self.assertTrue(any(c is first for c in as_list))
+
+        with self.assertRaises(IndexError):
+            candidates[len(candidates)]
+
+    def test_generate_candidates_batch(self):
+        """Test batch search matches per-precursor search"""
+        precursor_mzs = [1052.95, 1000.0, 1500.0]
+        charges = [2, 2, 3]
+
+        batch = self.generator.generate_candidates_batch(
+            precursor_mzs, charges, tolerance_ppm=100.0
+        )
+        self.assertEqual(len(batch), len(precursor_mzs))
+
+        for candidates, mz, z in zip(batch, precursor_mzs, charges):
+            single = self.generator.generate_candidates(mz, z, tolerance_ppm=100.0)
+            self.assertEqual(
+                [(c.peptide.sequence, c.glycan.composition, c.charge) for c in candidates],
+                [(c.peptide.sequence, c.glycan.composition, c.charge) for c in single]
+            )
+
     def test_filter_by_glycosylation_sites(self):
         """Test glycosylation site filtering"""
         # Generate some candidates
@@ -383,6 +532,26 @@ class TestCandidateGenerator(unittest.TestCase):
         for candidate in filtered:
             self.assertTrue(candidate.peptide.has_glycosylation_site)
 
+    def test_generate_candidates_glyco_only(self):
+        """Test searching the full peptide index vs the glyco-peptide index"""
+        # AGFAGDDAPR (no sequon) + first glycan, z=2
+        mass = self.peptides[1].mass + self.glycans[0].mass
+        precursor_mz = (mass + 2 * 1.007276) / 2
+
+        all_candidates = self.generator.generate_candidates(
+            precursor_mz=precursor_mz, charge=2, tolerance_ppm=10.0, glyco_only=False
+        )
+        self.assertIn("AGFAGDDAPR", [c.peptide.sequence for c in all_candidates])
+
+        glyco_candidates = self.generator.generate_candidates(
+            precursor_mz=precursor_mz, charge=2, tolerance_ppm=10.0
+        )
+        filtered = self.generator.filter_by_glycosylation_sites(all_candidates)
+        self.assertEqual(
+            [(c.peptide.sequence, c.glycan.composition) for c in glyco_candidates],
+            [(c.peptide.sequence, c.glycan.composition) for c in filtered]
+        )
+
     def test_get_statistics(self):
         """Test candidate statistics"""
         candidates = self.generator.generate_candidates(
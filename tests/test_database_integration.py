@@ -11,7 +11,7 @@ This validates the integration between all database modules.
 
 Usage:
     pytest tests/test_database_integration.py -v
-    python tests/test_database_integration.py  # Standalone mode
+    python -m tests.test_database_integration  # Standalone mode, from the repository root
 
 Author: Glycoproteomics Pipeline Team
 Date: 2025-10-21
@@ -22,18 +22,40 @@ import sys
 import os
 import tempfile
 import unittest
-from pathlib import Path
-
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.database import (
     FastaParser, Peptide, Protein,
-    GlycanDatabase, Glycan, GlycanType,
+    Glycan, GlycanType, get_default_glycan_db,
     CandidateGenerator, GlycopeptideCandidate
 )
 
 
+# Step-by-step output is for standalone runs; under pytest it is only
+# printed when GLYCO_VERBOSE_TESTS is set
+_VERBOSE = __name__ == "__main__" or bool(os.environ.get("GLYCO_VERBOSE_TESTS"))
+
+
+def _log(*args, **kwargs):
+    """print() when verbose test output is enabled"""
+    if _VERBOSE:
+        print(*args, **kwargs)
+
+
+# Realistic glycoprotein sequences, written to the fixture file in one call
+FASTA_TEXT = (
+    # Fetuin-A (human) - a well-known glycoprotein
+    ">sp|P02765|FETUA_HUMAN Alpha-2-HS-glycoprotein\n"
+    "MKVPWLWLFLFLGATVLAAGDYKSGLVPGKQTLVVQNNSHVNEAGKPF\n"
+    "QLFGSPSGQKDLLFKDSAIGFSRVPPQSDQWQSGTSQNNALVFSVDKL\n"
+    "QGDQEGDEPVWCEEPQKDEGVHFGAKVSRGEVLLKFQTDNHNHKQIGG\n"
+    "KCPDCPLLAPLNDSRVVHAVEVALATFNAESYTNTDTSYFVFDRDQKR\n"
+    # IgG1 Fc fragment - contains N-glycosylation site
+    ">sp|P01857|IGHG1_HUMAN Ig gamma-1 chain C region\n"
+    "ASTKGPSVFPLAPSSKSTSGGTAALGCLVKDYFPEPVTVSWNSGALTS\n"
+    "GVHTFPAVLQSSGLYSLSSVVTVPSSSLGTQTYICNVNHKPSNTKVDKK\n"
+)
+
+
 class TestDatabaseIntegration(unittest.TestCase):
     """Test complete database workflow integration"""
 
@@ -46,19 +68,7 @@ class TestDatabaseIntegration(unittest.TestCase):
             delete=False,
             suffix='.fasta'
         )
-
-        # Fetuin-A (human) - a well-known glycoprotein
-        cls.temp_fasta.write(">sp|P02765|FETUA_HUMAN Alpha-2-HS-glycoprotein\n")
-        cls.temp_fasta.write("MKVPWLWLFLFLGATVLAAGDYKSGLVPGKQTLVVQNNSHVNEAGKPF\n")
-        cls.temp_fasta.write("QLFGSPSGQKDLLFKDSAIGFSRVPPQSDQWQSGTSQNNALVFSVDKL\n")
-        cls.temp_fasta.write("QGDQEGDEPVWCEEPQKDEGVHFGAKVSRGEVLLKFQTDNHNHKQIGG\n")
-        cls.temp_fasta.write("KCPDCPLLAPLNDSRVVHAVEVALATFNAESYTNTDTSYFVFDRDQKR\n")
-
-        # IgG1 Fc fragment - contains N-glycosylation site
-        cls.temp_fasta.write(">sp|P01857|IGHG1_HUMAN Ig gamma-1 chain C region\n")
-        cls.temp_fasta.write("ASTKGPSVFPLAPSSKSTSGGTAALGCLVKDYFPEPVTVSWNSGALTS\n")
-        cls.temp_fasta.write("GVHTFPAVLQSSGLYSLSSVVTVPSSSLGTQTYICNVNHKPSNTKVDKK\n")
-
+        cls.temp_fasta.write(FASTA_TEXT)
         cls.temp_fasta.close()
 
     @classmethod
@@ -70,22 +80,22 @@ class TestDatabaseIntegration(unittest.TestCase):
         """Test complete workflow: FASTA → Peptides → Glycans → Candidates"""
 
         # Step 1: Parse FASTA file
-        print("\n" + "="*80)
-        print("STEP 1: Parse FASTA File")
-        print("="*80)
+        _log("\n" + "="*80)
+        _log("STEP 1: Parse FASTA File")
+        _log("="*80)
 
         parser = FastaParser(self.temp_fasta.name)
         proteins = parser.parse()
 
         self.assertEqual(len(proteins), 2)
-        print(f"✓ Parsed {len(proteins)} proteins")
+        _log(f"✓ Parsed {len(proteins)} proteins")
         for protein in proteins:
-            print(f"  - {protein.id}: {len(protein.sequence)} residues")
+            _log(f"  - {protein.id}: {len(protein.sequence)} residues")
 
         # Step 2: Digest proteins
-        print("\n" + "="*80)
-        print("STEP 2: In-Silico Tryptic Digestion")
-        print("="*80)
+        _log("\n" + "="*80)
+        _log("STEP 2: In-Silico Tryptic Digestion")
+        _log("="*80)
 
         peptides = parser.digest(
             enzyme='trypsin',
@@ -95,52 +105,52 @@ class TestDatabaseIntegration(unittest.TestCase):
         )
 
         self.assertGreater(len(peptides), 0)
-        print(f"✓ Generated {len(peptides)} peptides")
+        _log(f"✓ Generated {len(peptides)} peptides")
 
         # Filter for glycopeptides
         glyco_peptides = parser.filter_by_glycosylation_site(peptides)
         self.assertGreater(len(glyco_peptides), 0)
-        print(f"✓ Found {len(glyco_peptides)} glycopeptides (with N-X-S/T motif)")
+        _log(f"✓ Found {len(glyco_peptides)} glycopeptides (with N-X-S/T motif)")
 
         # Show statistics
         stats = parser.get_statistics(peptides)
-        print(f"\nPeptide Statistics:")
-        print(f"  Total peptides: {stats['total_peptides']}")
-        print(f"  With glyco sites: {stats['with_glycosylation_sites']} "
-              f"({stats['glycosylation_percentage']:.1f}%)")
-        print(f"  Mass range: {stats['mass_range'][0]:.2f} - {stats['mass_range'][1]:.2f} Da")
-        print(f"  Length range: {stats['length_range'][0]} - {stats['length_range'][1]} AA")
+        _log(f"\nPeptide Statistics:")
+        _log(f"  Total peptides: {stats['total_peptides']}")
+        _log(f"  With glyco sites: {stats['with_glycosylation_sites']} "
+             f"({stats['glycosylation_percentage']:.1f}%)")
+        _log(f"  Mass range: {stats['mass_range'][0]:.2f} - {stats['mass_range'][1]:.2f} Da")
+        _log(f"  Length range: {stats['length_range'][0]} - {stats['length_range'][1]} AA")
 
         # Step 3: Load glycan database
-        print("\n" + "="*80)
-        print("STEP 3: Load Glycan Database")
-        print("="*80)
+        _log("\n" + "="*80)
+        _log("STEP 3: Load Glycan Database")
+        _log("="*80)
 
-        glycan_db = GlycanDatabase()
+        glycan_db = get_default_glycan_db()
         self.assertGreater(len(glycan_db.glycans), 0)
-        print(f"✓ Loaded {len(glycan_db.glycans)} glycan structures")
+        _log(f"✓ Loaded {len(glycan_db.glycans)} glycan structures")
 
         # Show glycan statistics
         glycan_stats = glycan_db.get_statistics()
-        print(f"\nGlycan Statistics:")
-        print(f"  Total glycans: {glycan_stats['total_glycans']}")
-        print(f"  Type distribution:")
+        _log(f"\nGlycan Statistics:")
+        _log(f"  Total glycans: {glycan_stats['total_glycans']}")
+        _log(f"  Type distribution:")
         for glycan_type, count in glycan_stats['type_distribution'].items():
-            print(f"    {glycan_type}: {count}")
-        print(f"  Mass range: {glycan_stats['mass_range'][0]:.2f} - "
-              f"{glycan_stats['mass_range'][1]:.2f} Da")
+            _log(f"    {glycan_type}: {count}")
+        _log(f"  Mass range: {glycan_stats['mass_range'][0]:.2f} - "
+             f"{glycan_stats['mass_range'][1]:.2f} Da")
 
         # Step 4: Generate candidates
-        print("\n" + "="*80)
-        print("STEP 4: Generate Glycopeptide Candidates")
-        print("="*80)
+        _log("\n" + "="*80)
+        _log("STEP 4: Generate Glycopeptide Candidates")
+        _log("="*80)
 
         generator = CandidateGenerator(glyco_peptides, glycan_db.glycans)
 
         # Show index size
         index_info = generator.get_index_size()
-        print(f"✓ Pre-computed {index_info['total_glycopeptides']:,} glycopeptide masses")
-        print(f"  Memory estimate: {index_info['memory_estimate_mb']:.2f} MB")
+        _log(f"✓ Pre-computed {index_info['total_glycopeptides']:,} glycopeptide masses")
+        _log(f"  Memory estimate: {index_info['memory_estimate_mb']:.2f} MB")
 
         # Test candidate generation for a realistic precursor
         # Example: peptide NGTIINEK (887.47 Da) + H5N4F1 (1722.64 Da) = 2610.11 Da
@@ -149,10 +159,10 @@ class TestDatabaseIntegration(unittest.TestCase):
         test_charge = 2
         test_tolerance_ppm = 10.0
 
-        print(f"\nSearching for candidates:")
-        print(f"  Precursor m/z: {test_precursor_mz}")
-        print(f"  Charge: {test_charge}+")
-        print(f"  Tolerance: ±{test_tolerance_ppm} ppm")
+        _log(f"\nSearching for candidates:")
+        _log(f"  Precursor m/z: {test_precursor_mz}")
+        _log(f"  Charge: {test_charge}+")
+        _log(f"  Tolerance: ±{test_tolerance_ppm} ppm")
 
         candidates = generator.generate_candidates(
             precursor_mz=test_precursor_mz,
@@ -160,25 +170,25 @@ class TestDatabaseIntegration(unittest.TestCase):
             tolerance_ppm=test_tolerance_ppm
         )
 
-        print(f"\n✓ Found {len(candidates)} candidates")
+        _log(f"\n✓ Found {len(candidates)} candidates")
 
         # Show top 5 candidates
         if len(candidates) > 0:
-            print(f"\nTop 5 Candidates (by PPM error):")
+            _log(f"\nTop 5 Candidates (by PPM error):")
             for i, candidate in enumerate(candidates[:5], 1):
-                print(f"  {i}. {candidate.peptide.sequence} + {candidate.glycan.composition}")
-                print(f"     Mass: {candidate.theoretical_mass:.4f} Da, "
-                      f"PPM: {candidate.ppm_error:+.2f}")
+                _log(f"  {i}. {candidate.peptide.sequence} + {candidate.glycan.composition}")
+                _log(f"     Mass: {candidate.theoretical_mass:.4f} Da, "
+                     f"PPM: {candidate.ppm_error:+.2f}")
 
             # Get candidate statistics
             candidate_stats = generator.get_statistics(candidates)
-            print(f"\nCandidate Statistics:")
-            print(f"  Total candidates: {candidate_stats['total_candidates']}")
-            print(f"  Unique peptides: {candidate_stats['unique_peptides']}")
-            print(f"  Unique glycans: {candidate_stats['unique_glycans']}")
-            print(f"  PPM error range: {candidate_stats['ppm_error_range'][0]:.2f} - "
-                  f"{candidate_stats['ppm_error_range'][1]:.2f}")
-            print(f"  Average PPM error: {candidate_stats['average_ppm_error']:.2f}")
+            _log(f"\nCandidate Statistics:")
+            _log(f"  Total candidates: {candidate_stats['total_candidates']}")
+            _log(f"  Unique peptides: {candidate_stats['unique_peptides']}")
+            _log(f"  Unique glycans: {candidate_stats['unique_glycans']}")
+            _log(f"  PPM error range: {candidate_stats['ppm_error_range'][0]:.2f} - "
+                 f"{candidate_stats['ppm_error_range'][1]:.2f}")
+            _log(f"  Average PPM error: {candidate_stats['average_ppm_error']:.2f}")
 
     def test_multiple_precursor_search(self):
         """Test candidate generation for multiple precursors"""
@@ -190,7 +200,7 @@ class TestDatabaseIntegration(unittest.TestCase):
         glyco_peptides = parser.filter_by_glycosylation_site(peptides)
 
         # Load glycans
-        glycan_db = GlycanDatabase()
+        glycan_db = get_default_glycan_db()
 
         # Create generator
         generator = CandidateGenerator(glyco_peptides, glycan_db.glycans)
@@ -212,7 +222,7 @@ class TestDatabaseIntegration(unittest.TestCase):
             total_candidates += len(candidates)
 
         # Should find at least some candidates
-        print(f"\n✓ Generated {total_candidates} candidates across {len(precursors)} precursors")
+        _log(f"\n✓ Generated {total_candidates} candidates across {len(precursors)} precursors")
 
     def test_glycan_type_filtering_integration(self):
         """Test filtering candidates by glycan type"""
@@ -224,7 +234,7 @@ class TestDatabaseIntegration(unittest.TestCase):
         glyco_peptides = parser.filter_by_glycosylation_site(peptides)
 
         # Load glycans and filter by type
-        glycan_db = GlycanDatabase()
+        glycan_db = get_default_glycan_db()
 
         # Test with high-mannose glycans only
         hm_glycans = glycan_db.filter_by_type(GlycanType.HIGH_MANNOSE)
@@ -244,7 +254,7 @@ class TestDatabaseIntegration(unittest.TestCase):
         for candidate in candidates:
             self.assertEqual(candidate.glycan.glycan_type, GlycanType.HIGH_MANNOSE)
 
-        print(f"\n✓ Generated {len(candidates)} high-mannose glycopeptide candidates")
+        _log(f"\n✓ Generated {len(candidates)} high-mannose glycopeptide candidates")
 
     def test_performance_with_large_library(self):
         """Test performance with realistic library sizes"""
@@ -256,7 +266,7 @@ class TestDatabaseIntegration(unittest.TestCase):
         glyco_peptides = parser.filter_by_glycosylation_site(peptides)
 
         # Load full glycan database
-        glycan_db = GlycanDatabase()
+        glycan_db = get_default_glycan_db()
 
         # Create generator
         import time
@@ -264,8 +274,8 @@ class TestDatabaseIntegration(unittest.TestCase):
         generator = CandidateGenerator(glyco_peptides, glycan_db.glycans)
         index_time = time.time() - start_time
 
-        print(f"\n✓ Indexed {len(glyco_peptides)} peptides × {len(glycan_db.glycans)} glycans")
-        print(f"  Indexing time: {index_time*1000:.2f} ms")
+        _log(f"\n✓ Indexed {len(glyco_peptides)} peptides × {len(glycan_db.glycans)} glycans")
+        _log(f"  Indexing time: {index_time*1000:.2f} ms")
 
         # Test search speed
         start_time = time.time()
@@ -276,8 +286,8 @@ class TestDatabaseIntegration(unittest.TestCase):
         )
         search_time = time.time() - start_time
 
-        print(f"✓ Search completed in {search_time*1000:.2f} ms")
-        print(f"  Found {len(candidates)} candidates")
+        _log(f"✓ Search completed in {search_time*1000:.2f} ms")
+        _log(f"  Found {len(candidates)} candidates")
 
         # Performance should be reasonable (< 100ms for search)
         self.assertLess(search_time, 0.1)
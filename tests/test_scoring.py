@@ -0,0 +1,279 @@
+"""
+Unit Tests for XCorr Scoring
+
+Tests the FFT-based XCorr scorer: single and batched scoring, the threaded
+batch path, the matched-peak cutoff, and the binning/background kernels.
+
+Usage:
+    pytest tests/test_scoring.py -v
+    python -m tests.test_scoring  # Standalone mode, from the repository root
+
+Author: Glycoproteomics Pipeline Team
+Date: 2025-10-21
+Phase: 3 (Week 3)
+"""
+
+import sys
+import unittest
+
+import numpy as np
+
+from src.scoring import XCorrScorer, ProcessedSpectrum, TheoreticalPeak
+from src.scoring import xcorr_scorer, _xcorr_kernels
+
+
+BIN_SIZE = 1.0005
+
+
+def _make_observed(num_bins: int, seed: int = 0) -> ProcessedSpectrum:
+    """Sparse random observed spectrum with about 10% occupied bins"""
+    rng = np.random.default_rng(seed)
+    binned = np.zeros(num_bins, dtype=np.float32)
+    occupied = rng.choice(num_bins, size=num_bins // 10, replace=False)
+    binned[occupied] = rng.uniform(0.1, 1.0, size=len(occupied))
+    return ProcessedSpectrum(
+        binned_intensities=binned,
+        bin_size=BIN_SIZE,
+        min_mz=0.0,
+        max_mz=num_bins * BIN_SIZE,
+        num_bins=num_bins,
+        num_peaks_original=len(occupied),
+        num_peaks_retained=len(occupied)
+    )
+
+
+def _make_theoretical(observed: ProcessedSpectrum, num_matched: int, num_random: int,
+                      rng: np.random.Generator):
+    """Peaks on num_matched occupied observed bins plus num_random anywhere"""
+    occupied = np.flatnonzero(observed.binned_intensities)
+    bins = np.concatenate((
+        rng.choice(occupied, size=num_matched, replace=False),
+        rng.integers(0, observed.num_bins, size=num_random)
+    ))
+    return [
+        TheoreticalPeak(mz=(b + 0.5) * BIN_SIZE, intensity=float(rng.uniform(0.5, 1.0)), ion_type='b')
+        for b in bins
+    ]
+
+
+def _reference_xcorr(scorer: XCorrScorer, observed: ProcessedSpectrum, theoretical) -> tuple:
+    """(raw_correlation, background) from an unpadded full-length complex FFT"""
+    theo = scorer._create_theoretical_binned(
+        theoretical, observed.bin_size, observed.min_mz, observed.max_mz, observed.num_bins
+    ).astype(np.float64)
+    obs = observed.binned_intensities.astype(np.float64)
+    correlation = np.fft.ifft(np.fft.fft(obs) * np.conj(np.fft.fft(theo))).real
+
+    n = len(correlation)
+    mask = np.ones(n, dtype=bool)
+    mask[:scorer.lag_range + 1] = False
+    mask[n - scorer.lag_range:] = False
+    return correlation[0], correlation[mask].mean()
+
+
+class TestXCorrScorer(unittest.TestCase):
+    """Test XCorrScorer single and batched scoring"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.rng = np.random.default_rng(42)
+        self.observed = _make_observed(2000)  # 2000 = 2^4 * 5^3: fft_len == num_bins
+        self.candidates = [
+            (f"cand_{k}", _make_theoretical(self.observed, 3 + k % 8, 10, self.rng))
+            for k in range(150)  # More than one BATCH_CHUNK_SIZE chunk
+        ]
+
+    def test_score_matches_full_fft(self):
+        """Test score() against the unpadded full-length FFT"""
+        scorer = XCorrScorer(workers=1)
+        for _, theoretical in self.candidates[:10]:
+            result = scorer.score(self.observed, theoretical)
+            raw, background = _reference_xcorr(scorer, self.observed, theoretical)
+            self.assertAlmostEqual(result.raw_correlation, raw, places=4)
+            self.assertAlmostEqual(result.background, background, places=5)
+            self.assertAlmostEqual(result.xcorr, raw - background, places=4)
+
+    def test_score_padded_length(self):
+        """Test padding a non-5-smooth bin count to fft_len stays close to the full FFT"""
+        observed = _make_observed(2003)
+        scorer = XCorrScorer(workers=1)
+        theoretical = _make_theoretical(observed, 8, 20, self.rng)
+
+        result = scorer.score(observed, theoretical)
+        self.assertGreater(observed.fft_len, observed.num_bins)
+
+        raw, background = _reference_xcorr(scorer, observed, theoretical)
+        self.assertAlmostEqual(result.raw_correlation, raw, places=4)
+        self.assertAlmostEqual(result.background, background, delta=0.05 * abs(background) + 1e-6)
+
+    def test_rank_candidates_matches_score(self):
+        """Test batched rank_candidates agrees with score() per candidate"""
+        scorer = XCorrScorer(workers=1)
+        ranked = scorer.rank_candidates(self.observed, self.candidates, return_all=True)
+        self.assertEqual(len(ranked), len(self.candidates))
+
+        theoreticals = dict(self.candidates)
+        for candidate, batch_score in ranked:
+            single = scorer.score(self.observed, theoreticals[candidate])
+            self.assertEqual(batch_score.matched_peaks, single.matched_peaks)
+            self.assertAlmostEqual(batch_score.raw_correlation, single.raw_correlation, places=4)
+            self.assertAlmostEqual(batch_score.background, single.background, places=5)
+            self.assertAlmostEqual(batch_score.xcorr, single.xcorr, places=4)
+
+        xcorrs = [score.xcorr for _, score in ranked]
+        self.assertEqual(xcorrs, sorted(xcorrs, reverse=True))
+
+    def test_rank_candidates_threaded(self):
+        """Test the thread-pool chunk path gives the serial results exactly"""
+        serial = XCorrScorer(workers=1).rank_candidates(self.observed, self.candidates, return_all=True)
+        threaded = XCorrScorer(workers=4).rank_candidates(self.observed, self.candidates, return_all=True)
+
+        self.assertEqual([c for c, _ in serial], [c for c, _ in threaded])
+        for (_, a), (_, b) in zip(serial, threaded):
+            self.assertEqual(
+                (a.xcorr, a.raw_correlation, a.background, a.matched_peaks),
+                (b.xcorr, b.raw_correlation, b.background, b.matched_peaks)
+            )
+
+    def test_rank_candidates_sp_score(self):
+        """Test (candidate, peaks, sp_score) tuples keep their Sp score"""
+        scorer = XCorrScorer(workers=1)
+        items = [(c, peaks, i) for i, (c, peaks) in enumerate(self.candidates[:5])]
+        ranked = scorer.rank_candidates(self.observed, items, return_all=True)
+        sp_by_candidate = {c: sp for c, _, sp in items}
+        for candidate, _, sp_score in ranked:
+            self.assertEqual(sp_score, sp_by_candidate[candidate])
+
+    def test_min_peaks_for_xcorr(self):
+        """Test candidates below min_peaks_for_xcorr score 0"""
+        scorer = XCorrScorer(workers=1, min_peaks_for_xcorr=3)
+        occupied = np.flatnonzero(self.observed.binned_intensities)
+        empty = np.flatnonzero(self.observed.binned_intensities == 0)
+        theoretical = [
+            TheoreticalPeak(mz=(b + 0.5) * BIN_SIZE, intensity=1.0, ion_type='y')
+            for b in np.concatenate((occupied[:2], empty[:5]))
+        ]
+
+        result = scorer.score(self.observed, theoretical)
+        self.assertEqual(result.matched_peaks, 2)
+        self.assertEqual(result.xcorr, 0.0)
+        self.assertEqual(result.background, 0.0)
+        self.assertGreater(result.raw_correlation, 0.0)
+
+        ranked = scorer.rank_candidates(self.observed, [("few", theoretical)], return_all=True)
+        self.assertEqual(ranked[0][1].xcorr, 0.0)
+        self.assertEqual(scorer.rank_candidates(self.observed, [("few", theoretical)]), [])
+
+        # 0 scores every candidate in full
+        full = XCorrScorer(workers=1, min_peaks_for_xcorr=0).score(self.observed, theoretical)
+        self.assertNotEqual(full.background, 0.0)
+
+    def test_cross_correlate_without_cached_rfft(self):
+        """Test _cross_correlate_fft computes the observed rfft when not given one"""
+        scorer = XCorrScorer(workers=1)
+        theoretical = scorer._create_theoretical_binned(
+            self.candidates[0][1], BIN_SIZE, 0.0, self.observed.max_mz, self.observed.num_bins
+        )
+        cached = scorer._cross_correlate_fft(
+            self.observed.binned_intensities, theoretical,
+            observed_fft=self.observed.ensure_rfft(1), fft_len=self.observed.fft_len
+        )
+        computed = scorer._cross_correlate_fft(self.observed.binned_intensities, theoretical)
+        np.testing.assert_array_equal(computed, cached)
+
+    def test_empty_theoretical(self):
+        """Test a candidate without peaks scores 0"""
+        result = XCorrScorer().score(self.observed, [])
+        self.assertEqual(result.xcorr, 0.0)
+        self.assertEqual(result.matched_peaks, 0)
+
+
+class TestXCorrKernels(unittest.TestCase):
+    """Test the NumPy fallback kernels agree with the loop kernels"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        rng = np.random.default_rng(7)
+        self.mz = rng.uniform(-10.0, 2100.0, size=500)
+        self.intensity = rng.uniform(0.0, 1.0, size=500)
+        self.correlation = rng.normal(size=1500).astype(np.float32)
+        self.nz_idx = np.sort(rng.choice(1500, size=200, replace=False)).astype(np.int64)
+
+    def _loop_kernels(self):
+        """(name, bin_peaks, background, count_matched): plain Python and the selected backend"""
+        return [
+            ("python", _xcorr_kernels.bin_peaks, _xcorr_kernels.background, _xcorr_kernels.count_matched),
+            ("selected", xcorr_scorer._bin_peaks, xcorr_scorer._background, xcorr_scorer._count_matched),
+        ]
+
+    def test_bin_peaks(self):
+        """Test binning kernels (float32 and float64 buffers)"""
+        for dtype in (np.float32, np.float64):
+            expected = np.zeros(2000, dtype=dtype)
+            xcorr_scorer._bin_peaks_numpy(self.mz, self.intensity, 0.0, 2000.0, BIN_SIZE, expected)
+            for name, bin_peaks, _, _ in self._loop_kernels():
+                with self.subTest(kernels=name, dtype=dtype.__name__):
+                    out = np.zeros(2000, dtype=dtype)
+                    bin_peaks(self.mz, self.intensity, 0.0, 2000.0, BIN_SIZE, out)
+                    np.testing.assert_allclose(out, expected, rtol=1e-6)
+
+    def test_background(self):
+        """Test background kernels"""
+        for lag_range in (0, 75, 749, 800):
+            expected = xcorr_scorer._background_numpy(self.correlation, lag_range)
+            for name, _, background, _ in self._loop_kernels():
+                with self.subTest(kernels=name, lag_range=lag_range):
+                    self.assertAlmostEqual(
+                        background(self.correlation, lag_range), expected, places=5
+                    )
+
+    def test_count_matched(self):
+        """Test matched-peak counting kernels"""
+        observed = np.where(self.correlation > 0, self.correlation, 0).astype(np.float32)
+        expected = xcorr_scorer._count_matched_numpy(observed, self.nz_idx)
+        for name, _, _, count_matched in self._loop_kernels():
+            with self.subTest(kernels=name):
+                self.assertEqual(count_matched(observed, self.nz_idx), expected)
+
+
+def run_test_suite():
+    """Run all scoring tests"""
+    print("="*80)
+    print("  SCORING MODULE UNIT TESTS")
+    print("="*80)
+    print()
+
+    # Create test suite
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+
+    # Add test classes
+    suite.addTests(loader.loadTestsFromTestCase(TestXCorrScorer))
+    suite.addTests(loader.loadTestsFromTestCase(TestXCorrKernels))
+
+    # Run tests
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+
+    # Summary
+    print()
+    print("="*80)
+    print("  TEST SUMMARY")
+    print("="*80)
+    print(f"  Tests Run: {result.testsRun}")
+    print(f"  Successes: {result.testsRun - len(result.failures) - len(result.errors)}")
+    print(f"  Failures: {len(result.failures)}")
+    print(f"  Errors: {len(result.errors)}")
+    print(f"  Skipped: {len(result.skipped)}")
+    print("="*80)
+
+    if result.wasSuccessful():
+        print("\n✅ ALL TESTS PASSED - Scoring modules validated!")
+        return 0
+    else:
+        print("\n❌ SOME TESTS FAILED - Review errors above")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(run_test_suite())